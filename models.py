@@ -1,9 +1,16 @@
 from datetime import datetime
 from typing import Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Instance __dict__ key holding the cached JSON (not a model field, so it is
+# ignored by validation, dumping and ==)
+_JSON_CACHE_KEY = "_json_bytes"
 
 
 class FreeFoodEvent(BaseModel):
+    # Events are never edited after creation; derive variants with model_copy
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "1.0.0"
     event_id: str
     title: str
@@ -17,3 +24,24 @@ class FreeFoodEvent(BaseModel):
     published_at: datetime
     retries: int = 0
     metadata: dict[str, Any] = Field(default_factory=dict)
+
+    def to_bytes(self) -> bytes:
+        """
+        JSON-encoded event, computed once and reused (retries, fan-out).
+
+        In-place edits of ``metadata`` are not tracked, so don't mutate it
+        after serializing.
+        """
+        cached = self.__dict__.get(_JSON_CACHE_KEY)
+        if cached is None:
+            cached = self.__pydantic_serializer__.to_json(self)
+            self.__dict__[_JSON_CACHE_KEY] = cached
+        return cached
+
+    def model_copy(
+        self, *, update: Optional[dict[str, Any]] = None, deep: bool = False
+    ) -> "FreeFoodEvent":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__dict__.pop(_JSON_CACHE_KEY, None)
+        return copied
@@ -6,7 +6,7 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 
 from redis import Redis
 
@@ -136,6 +136,41 @@ def add_user(email: str) -> bool:
         return False
 
 
+def add_users_bulk(emails: list[str]) -> tuple[list[str], list[str]]:
+    """Add many user subscriptions with one INSERT per chunk.
+
+    Returns (added, already_subscribed), both in input order.
+    """
+    inserted: set[str] = set()
+    # Stay well under SQLite's bound-parameter limit
+    chunk_size = 500
+
+    with db_transaction() as conn:
+        cursor = conn.cursor()
+        for i in range(0, len(emails), chunk_size):
+            chunk = emails[i : i + chunk_size]
+            placeholders = ", ".join("(?)" for _ in chunk)
+            cursor.execute(
+                f"INSERT INTO users (email) VALUES {placeholders} "
+                "ON CONFLICT (email) DO NOTHING RETURNING email",
+                chunk,
+            )
+            inserted.update(row["email"] for row in cursor.fetchall())
+
+    added: list[str] = []
+    already_subscribed: list[str] = []
+    for email in emails:
+        if email in inserted:
+            added.append(email)
+            inserted.discard(email)  # later duplicates count as existing
+        else:
+            already_subscribed.append(email)
+
+    if added:
+        invalidate_users_cache()
+    return added, already_subscribed
+
+
 def get_user(email: str) -> Optional[dict]:
     """Get user by email."""
     conn = get_connection()
@@ -193,6 +228,33 @@ def get_active_users() -> list[str]:
     return emails
 
 
+def count_active_users() -> int:
+    """Count active users without loading their emails."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT COUNT(*) AS total FROM users WHERE active = 1")
+    return cursor.fetchone()["total"]
+
+
+def iter_active_users_sorted(batch_size: int = 1000) -> Iterator[str]:
+    """Yield active user emails in sorted order, fetching in batches.
+
+    Uses its own connection so the iterator can be consumed from any thread
+    (e.g. by a streaming HTTP response) without holding every row in memory.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0)
+    try:
+        cursor = conn.execute("SELECT email FROM users WHERE active = 1 ORDER BY email")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for (email,) in rows:
+                yield email
+    finally:
+        conn.close()
+
+
 def invalidate_users_cache():
     """Invalidate the active users cache."""
     redis = _get_redis()
@@ -1,7 +1,7 @@
-import json
 import logging
 import os
-from typing import Any, Callable, Optional
+import threading
+from typing import Any, Callable, ClassVar, Iterable, Optional
 from redis import Redis
 from redis.connection import ConnectionPool
 from models import FreeFoodEvent
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "50"))
 REDIS_POOL_TIMEOUT = int(os.getenv("REDIS_POOL_TIMEOUT", "30"))
 
+# Background batch publishing (see BatchPublisher)
+PUBLISH_BATCH_MAX = int(os.getenv("PUBLISH_BATCH_MAX", "100"))
+PUBLISH_LINGER_MS = int(os.getenv("PUBLISH_LINGER_MS", "5"))
+
 _redis_pool: Optional[ConnectionPool] = None
 
 
@@ -46,19 +50,147 @@ class MessageQueue:
         return self._client
 
     def publish(self, event: FreeFoodEvent) -> str:
-        event_data = event.model_dump(mode="json")
-        event_json = json.dumps(event_data)
-        message_id = str(self.client.xadd(self.stream_name, {"data": event_json}))
-        logger.info(f"Published event {event.event_id} to {self.stream_name}")
+        # Serialized once per event; republishing reuses the cached bytes
+        message_id = self.publish_raw(event.to_bytes())
+        logger.info("Published event %s to %s", event.event_id, self.stream_name)
         return message_id
 
+    def publish_many(self, events: Iterable[FreeFoodEvent]) -> list[str]:
+        """
+        Publish several events in one round-trip (pipelined XADDs).
+
+        Returns the message ids in the same order as ``events``.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(self.stream_name, {"data": event.to_bytes()})
+        message_ids = [str(message_id) for message_id in pipe.execute()]
+        logger.info("Published %d events to %s", len(message_ids), self.stream_name)
+        return message_ids
+
+    def publish_raw(self, event_json: str | bytes) -> str:
+        """
+        Publish an already-serialized event.
+
+        Lets callers that send the same payload repeatedly (retries, fan-out,
+        load generators) serialize once and skip the per-call model dump.
+        """
+        return str(self.client.xadd(self.stream_name, {"data": event_json}))
+
     def close(self):
         if self._client:
             self._client.close()
             self._client = None
 
 
+class BatchPublisher:
+    """
+    Buffer events and publish them in pipelined batches off the caller's thread.
+
+    enqueue() only appends to a buffer. The first event enqueued into an empty
+    buffer starts a ``linger_ms`` timer; when it expires, or as soon as
+    ``max_batch`` events are waiting, a background thread flushes the buffer
+    with publish_many. An idle publisher sleeps until the next enqueue.
+
+    A batch that fails to publish is put back at the front of the buffer and
+    retried on the next flush. Use as a context manager, or call close(), so
+    the tail is sent; close() raises if the final flush fails, and enqueue()
+    raises once the publisher is closed.
+    """
+
+    def __init__(
+        self,
+        mq: MessageQueue,
+        max_batch: int = PUBLISH_BATCH_MAX,
+        linger_ms: int = PUBLISH_LINGER_MS,
+    ):
+        self.mq = mq
+        self.max_batch = max_batch
+        self.linger_s = linger_ms / 1000
+        self._buffer: list[FreeFoodEvent] = []
+        self._lock = threading.Lock()
+        self._pending = threading.Event()  # buffer is non-empty
+        self._full = threading.Event()  # buffer reached max_batch
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="mq-batch-publisher", daemon=True
+        )
+        self._thread.start()
+
+    def enqueue(self, event: FreeFoodEvent) -> None:
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("BatchPublisher is closed")
+            self._buffer.append(event)
+            self._signal()
+
+    def _signal(self) -> None:
+        # Caller holds _lock. _pending/_full always mirror the buffer (and stay
+        # set once closed), so a flush from any thread can't leave a stale or
+        # missing wakeup behind.
+        size = len(self._buffer)
+        closed = self._closed.is_set()
+        if size or closed:
+            self._pending.set()
+        else:
+            self._pending.clear()
+        if size >= self.max_batch or closed:
+            self._full.set()
+        else:
+            self._full.clear()
+
+    def flush(self) -> list[str]:
+        """
+        Publish everything buffered so far; returns the message ids.
+
+        On failure the batch is put back at the front of the buffer and the
+        error is re-raised.
+        """
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._signal()
+        if not batch:
+            return []
+        try:
+            return self.mq.publish_many(batch)
+        except Exception:
+            with self._lock:
+                self._buffer[:0] = batch
+                self._signal()
+            raise
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            if self._closed.is_set():
+                return
+            # Linger so the batch can fill, unless it is already full
+            self._full.wait(self.linger_s)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Error publishing batch, will retry: %s", e)
+                # Don't hammer a Redis that is down; close() still wakes us
+                self._closed.wait(1.0)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed.set()
+            self._signal()
+        self._thread.join()
+        self.flush()
+
+    def __enter__(self) -> "BatchPublisher":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 class Consumer:
+    # (stream, group) pairs already created or confirmed in this process
+    _known_groups: ClassVar[set[tuple[str, str]]] = set()
+
     def __init__(
         self,
         redis_url: str = REDIS_URL,
@@ -80,6 +212,9 @@ class Consumer:
         return self._client
 
     def _ensure_consumer_group(self):
+        key = (self.stream_name, self.consumer_group)
+        if key in self._known_groups:
+            return
         try:
             self._client.xgroup_create(
                 self.stream_name, self.consumer_group, id="0", mkstream=True
@@ -88,12 +223,14 @@ class Consumer:
         except Exception as e:
             if "BUSYGROUP" not in str(e):
                 logger.error(f"Error creating consumer group: {e}")
+                return
+        self._known_groups.add(key)
 
     def consume(
         self,
         handler: Callable[[FreeFoodEvent], None],
         block: int = 5000,
-        count: int = 10,
+        count: int = 100,
     ):
         logger.info(f"Starting consumer {self.consumer_name} on {self.stream_name}")
 
@@ -111,35 +248,70 @@ class Consumer:
                     continue
 
                 for stream, message_list in messages:  # type: ignore[union-attr]
-                    for message_id, data in message_list:
-                        self._process_message(message_id, data, handler)
+                    self._process_batch(message_list, handler)
 
             except KeyboardInterrupt:
                 logger.info("Consumer shutting down")
                 break
             except Exception as e:
                 logger.error(f"Error in consumer loop: {e}")
+                if "NOGROUP" in str(e):
+                    # Stream or group was deleted (e.g. FLUSHALL): recreate it
+                    self._known_groups.discard((self.stream_name, self.consumer_group))
+                    self._ensure_consumer_group()
 
-    def _process_message(
+    def _handle_message(
         self,
         message_id: str,
         data: dict[str, Any],
         handler: Callable[[FreeFoodEvent], None],
-    ):
+    ) -> bool:
+        """Decode and handle one message; returns True if it should be acked."""
+        # Field names are str with decode_responses, bytes on a raw client
+        if (raw := data.get("data")) is None and (raw := data.get(b"data")) is None:
+            logger.warning("Message %s has no data field", message_id)
+            return False
+
         try:
-            event_data = json.loads(data.get("data", "{}"))
-            event = FreeFoodEvent(**event_data)
+            # Parse and validate in one pass (pydantic-core's JSON parser,
+            # no intermediate dict)
+            event = FreeFoodEvent.model_validate_json(raw)
 
             major_version = event.schema_version.split(".")[0]
             if major_version != "1":
-                logger.warning(f"Unsupported schema version: {event.schema_version}")
+                logger.warning("Unsupported schema version: %s", event.schema_version)
 
             handler(event)
-            self.client.xack(self.stream_name, self.consumer_group, message_id)
-            logger.info(f"Processed event {event.event_id}")
+            logger.info("Processed event %s", event.event_id)
+            return True
 
         except Exception as e:
-            logger.error(f"Error processing message {message_id}: {e}")
+            logger.error("Error processing message %s: %s", message_id, e)
+            return False
+
+    def _process_message(
+        self,
+        message_id: str,
+        data: dict[str, Any],
+        handler: Callable[[FreeFoodEvent], None],
+    ):
+        if self._handle_message(message_id, data, handler):
+            self.client.xack(self.stream_name, self.consumer_group, message_id)
+
+    def _process_batch(
+        self,
+        message_list: list[tuple[str, dict[str, Any]]],
+        handler: Callable[[FreeFoodEvent], None],
+    ) -> int:
+        """Handle a batch read by XREADGROUP and ack the successes in one XACK."""
+        acked = [
+            message_id
+            for message_id, data in message_list
+            if self._handle_message(message_id, data, handler)
+        ]
+        if acked:
+            self.client.xack(self.stream_name, self.consumer_group, *acked)
+        return len(acked)
 
     def close(self):
         if self._client:
@@ -32,31 +32,34 @@ class EventProcessor:
         """
         try:
             logger.info(
-                f"Processing event: {event.event_id} | "
-                f"Title: {event.title} | "
-                f"Location: {event.location} | "
-                f"Source: {event.source}"
+                "Processing event: %s | Title: %s | Location: %s | Source: %s",
+                event.event_id,
+                event.title,
+                event.location,
+                event.source,
             )
 
             # Validate event confidence
             if event.llm_confidence is not None:
                 if event.llm_confidence < 0.5:
                     logger.warning(
-                        f"Low confidence event ({event.llm_confidence:.2f}): "
-                        f"{event.event_id}"
+                        "Low confidence event (%.2f): %s",
+                        event.llm_confidence,
+                        event.event_id,
                     )
                 else:
                     logger.info(
-                        f"High confidence event ({event.llm_confidence:.2f}): "
-                        f"{event.event_id}"
+                        "High confidence event (%.2f): %s",
+                        event.llm_confidence,
+                        event.event_id,
                     )
 
             # Log event details
             if event.reason:
-                logger.info(f"Classification reason: {event.reason}")
+                logger.info("Classification reason: %s", event.reason)
 
             if event.start_time:
-                logger.info(f"Event starts at: {event.start_time}")
+                logger.info("Event starts at: %s", event.start_time)
 
             # Track metrics
             self.events_processed += 1
@@ -68,7 +71,7 @@ class EventProcessor:
                 if pub_time.tzinfo is None:
                     pub_time = pub_time.replace(tzinfo=timezone.utc)
                 latency = (now - pub_time).total_seconds()
-                logger.info(f"Processing latency: {latency:.3f}s")
+                logger.info("Processing latency: %.3fs", latency)
 
             # Here you would typically:
             # 1. Store event in database
@@ -77,14 +80,15 @@ class EventProcessor:
             # 4. Track analytics
 
             logger.info(
-                f"Successfully processed event {event.event_id}. "
-                f"Total processed: {self.events_processed}"
+                "Successfully processed event %s. Total processed: %d",
+                event.event_id,
+                self.events_processed,
             )
 
         except Exception as e:
             self.events_failed += 1
             logger.error(
-                f"Failed to process event {event.event_id}: {e}", exc_info=True
+                "Failed to process event %s: %s", event.event_id, e, exc_info=True
             )
             raise
 
@@ -121,8 +125,7 @@ def main():
         # Start consuming events
         consumer.consume(
             handler=processor.process_event,
-            block=5000,
-            count=10,  # 5 second timeout
+            block=5000,  # 5 second timeout
         )
 
     except KeyboardInterrupt:
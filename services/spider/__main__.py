@@ -14,29 +14,34 @@ Features:
 """
 
 import asyncio
+import contextlib
 import datetime as dt
 import hashlib
 import json
 import logging
 import os
 import re
+import sqlite3
 import sys
 import time
-import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple, Union
 from urllib.parse import urljoin, urlparse
 from zoneinfo import ZoneInfo
 
 import aiohttp
-from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+import httpx
+import lxml.html
 from dotenv import load_dotenv
 from google import genai
-from google.genai.types import GenerateContentConfig
+from google.genai.types import GenerateContentConfig, HttpOptions
+from lxml import etree
 
-# Suppress XML parsing warnings (common with mixed HTML/XML content)
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+try:
+    import uvloop  # shipped with uvicorn[standard] on non-Windows platforms
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
 
 # Load environment variables
 load_dotenv()
@@ -55,6 +60,22 @@ DEFAULT_DAYS_LOOKAHEAD = int(os.getenv("SPIDER_DAYS_LOOKAHEAD", "90"))
 DEFAULT_CONCURRENT_REQUESTS = int(os.getenv("SPIDER_CONCURRENT_REQUESTS", "10"))
 DEFAULT_MIN_CONFIDENCE = float(os.getenv("SPIDER_MIN_CONFIDENCE", "0.60"))
 
+# Connection pool / retry settings for the HTTP client
+DEFAULT_POOL_SIZE = int(os.getenv("SPIDER_POOL_SIZE", "64"))
+DEFAULT_KEEPALIVE_TIMEOUT_S = float(os.getenv("SPIDER_KEEPALIVE_TIMEOUT_S", "30"))
+DEFAULT_HTTP_RETRIES = int(os.getenv("SPIDER_HTTP_RETRIES", "2"))
+DEFAULT_RETRY_BACKOFF_S = float(os.getenv("SPIDER_RETRY_BACKOFF_S", "0.3"))
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Only HTML-ish bodies under this size are downloaded and parsed
+MAX_PAGE_BYTES = int(os.getenv("SPIDER_MAX_PAGE_BYTES", "2000000"))
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml", "application/xml", "text/xml")
+
+# On-disk page cache shared between runs ("" disables it)
+SPIDER_CACHE_PATH = os.getenv("SPIDER_CACHE_PATH", ".spider-cache.sqlite3")
+# Commit the page cache after this many writes, so a crash loses little
+SPIDER_CACHE_COMMIT_EVERY = int(os.getenv("SPIDER_CACHE_COMMIT_EVERY", "25"))
+
 # Default seed URLs
 DEFAULT_SEED_URLS = os.getenv("SPIDER_SEED_URLS", "https://events.umass.edu").split(",")
 
@@ -66,8 +87,55 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
 GEMINI_TIMEOUT_S = int(os.getenv("GEMINI_TIMEOUT_S", "12"))
 GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", "2"))
+GEMINI_BATCH_MAX = int(os.getenv("GEMINI_BATCH_MAX", "8"))
+GEMINI_BATCH_WINDOW_MS = int(os.getenv("GEMINI_BATCH_WINDOW_MS", "250"))
+
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "32"))
+
+
+# (loop, client) for the event loop the Gemini client was built on
+_gemini: Optional[Tuple[asyncio.AbstractEventLoop, genai.Client]] = None
+
+
+def _make_gemini_client() -> genai.Client:
+    """Build a Gemini client with a pooled async transport."""
+    # Sized for concurrent batched confirmations; keep-alive (and HTTP/2
+    # multiplexing when h2 is installed) avoids a TLS handshake per call.
+    limits = httpx.Limits(
+        max_connections=GEMINI_MAX_CONNECTIONS,
+        max_keepalive_connections=GEMINI_MAX_CONNECTIONS,
+    )
+    try:
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits)
+    except ImportError:
+        transport = httpx.AsyncHTTPTransport(limits=limits)
+
+    return genai.Client(
+        api_key=GEMINI_API_KEY,
+        http_options=HttpOptions(
+            timeout=GEMINI_TIMEOUT_S * 1000,  # milliseconds
+            async_client_args={"transport": transport},
+        ),
+    )
+
+
+def get_gemini_client() -> Optional[genai.Client]:
+    """
+    Get the Gemini client for the running event loop (None without a key).
+
+    The httpx async transport's pool belongs to one loop, so a new client is
+    built when called from a different loop, e.g. per crawl's asyncio Runner.
+    """
+    global _gemini
+
+    if not GEMINI_API_KEY:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _gemini is None or _gemini[0] is not loop:
+        _gemini = (loop, _make_gemini_client())
+    return _gemini[1]
 
-client = genai.Client(api_key=GEMINI_API_KEY) if GEMINI_API_KEY else None
 
 # Comprehensive food keywords (grouped by category)
 FOOD_KEYWORDS = {
@@ -159,6 +227,13 @@ NEGATION_PHRASES = [
     "byo food",
 ]
 
+# Pre-compiled alternations so the prefilter is a single pass over the text
+# instead of one substring scan per keyword.
+_FOOD_KEYWORD_RE = re.compile(
+    "|".join(map(re.escape, ALL_FOOD_KEYWORDS)), re.IGNORECASE
+)
+_NEGATION_RE = re.compile("|".join(map(re.escape, NEGATION_PHRASES)), re.IGNORECASE)
+
 # URL patterns that indicate event pages (for prioritization)
 EVENT_URL_PATTERNS = [
     r"/events?/",
@@ -203,6 +278,9 @@ class CrawlStatistics:
     gemini_calls: int = 0
     gemini_errors: int = 0
     cache_hits: int = 0
+    not_modified: int = 0
+    skipped_non_html: int = 0
+    too_large: int = 0
     start_time: float = field(default_factory=time.time)
     errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
 
@@ -220,6 +298,9 @@ class CrawlStatistics:
             "gemini_calls": self.gemini_calls,
             "gemini_errors": self.gemini_errors,
             "cache_hits": self.cache_hits,
+            "not_modified": self.not_modified,
+            "skipped_non_html": self.skipped_non_html,
+            "too_large": self.too_large,
             "crawl_rate_pages_per_sec": round(
                 self.pages_crawled / max(self.elapsed_time(), 1), 2
             ),
@@ -286,55 +367,85 @@ def _try_parse_dt(s: str) -> Optional[dt.datetime]:
     return None
 
 
-def _within_lookahead(start_iso: str, days_lookahead: int) -> bool:
-    now = dt.datetime.now(UTC)
-    end_window = now + dt.timedelta(days=days_lookahead)
-    sdt = _try_parse_dt(start_iso.replace("Z", "+00:00"))
-    if not sdt:
-        return False
-    return now <= sdt <= end_window
+def _within_lookahead(
+    start_dt: dt.datetime, now: dt.datetime, end_window: dt.datetime
+) -> bool:
+    return now <= start_dt <= end_window
 
 
 # ----------------------------
 # Text helpers
 # ----------------------------
-def _clean_text_from_html(html: str) -> str:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    txt = soup.get_text(" ", strip=True)
+# lxml's C parser is much faster than html.parser for the hot per-page
+# helpers; XPath expressions are compiled once.
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style or ancestor::noscript)]"
+)
+_LINK_HREF_XPATH = etree.XPath("//a/@href")
+_JSONLD_XPATH = etree.XPath('//script[@type="application/ld+json"]/text()')
+
+
+def _parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse an HTML document with lxml, returning None if it can't be parsed."""
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        try:
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+        except Exception:
+            return None
+    except Exception:
+        return None
+
+
+def _text_from_tree(tree: lxml.html.HtmlElement) -> str:
+    txt = " ".join(t.strip() for t in _VISIBLE_TEXT_XPATH(tree))
     txt = re.sub(r"\s+", " ", txt).strip()
     return txt
 
 
-def _keyword_might_have_free_food(text: str) -> bool:
-    """Enhanced keyword detection with context."""
-    t = (text or "").lower()
+def _clean_text_from_html(html: str) -> str:
+    tree = _parse_html(html)
+    if tree is None:
+        return ""
+    return _text_from_tree(tree)
 
-    # Check for negations first
-    if any(neg in t for neg in NEGATION_PHRASES):
-        return False
 
-    # Check for explicit free food mentions (highest priority)
-    if any(k in t for k in FOOD_KEYWORDS["explicit_free"]):
-        return True
+def _clean_text_from_fragment(fragment: str) -> str:
+    """Plain text of an HTML snippet (e.g. a JSON-LD description)."""
+    try:
+        tree = lxml.html.fragment_fromstring(fragment, create_parent="div")
+    except Exception:
+        return re.sub(r"\s+", " ", fragment).strip()
+    return _text_from_tree(tree)
 
-    # Check for food provided + specific foods (medium priority)
-    has_food_provided = any(k in t for k in FOOD_KEYWORDS["food_provided"])
-    has_specific_food = any(k in t for k in FOOD_KEYWORDS["specific_foods"])
 
-    if has_food_provided or has_specific_food:
-        return True
+def _keyword_might_have_free_food(text: str) -> bool:
+    """
+    Enhanced keyword detection with context.
+
+    Both patterns are case-insensitive, so callers pass page text as-is
+    instead of allocating a lowered copy.
+    """
+    if not text:
+        return False
 
-    # Check for meal types + beverages
-    has_meal_type = any(k in t for k in FOOD_KEYWORDS["meal_types"])
-    has_beverage = any(k in t for k in FOOD_KEYWORDS["beverages"])
+    # Check for negations first
+    if _NEGATION_RE.search(text):
+        return False
 
-    return has_meal_type or has_beverage
+    # Any explicit mention, provided-food phrase, specific food, meal type
+    # or beverage is enough to pass the prefilter.
+    return _FOOD_KEYWORD_RE.search(text) is not None
 
 
 def _stable_event_id(title: str, start_iso: str, location: str, source_url: str) -> str:
     key = f"{title.strip().lower()}|{start_iso}|{location.strip().lower()}|{source_url}"
+    # This ID is persisted as events.external_source_id and used as the upsert
+    # key, so the hash must stay SHA-256; changing it would duplicate every
+    # already-saved event. In-process-only keys (URL fingerprints, the JSON-LD
+    # cache) use blake2b instead.
     return hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
 
 
@@ -358,22 +469,35 @@ def _normalize_url(base: str, href: str) -> Optional[str]:
     return u
 
 
+def _url_fingerprint(url: str) -> int:
+    """64-bit hash of a URL, used as a compact key for the visited set."""
+    return int.from_bytes(
+        hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
 def _is_likely_event_page(url: str) -> bool:
     """Check if URL pattern suggests an event page (for prioritization)."""
     url_lower = url.lower()
     return any(re.search(pattern, url_lower) for pattern in EVENT_URL_PATTERNS)
 
 
-def _extract_links(html: str, base_url: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
+def _links_from_tree(tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
     out: List[str] = []
-    for a in soup.find_all("a", href=True):
-        u = _normalize_url(base_url, a["href"])
+    for href in _LINK_HREF_XPATH(tree):
+        u = _normalize_url(base_url, str(href))
         if u:
             out.append(u)
     return list(dict.fromkeys(out))
 
 
+def _extract_links(html: str, base_url: str) -> List[str]:
+    tree = _parse_html(html)
+    if tree is None:
+        return []
+    return _links_from_tree(tree, base_url)
+
+
 # ----------------------------
 # Event extraction (multi-platform)
 # ----------------------------
@@ -397,16 +521,52 @@ def _detect_platform(url: str, html: str) -> str:
     return "custom"
 
 
-def _extract_event_from_jsonld(html: str, page_url: str) -> Optional[Dict[str, Any]]:
+_JSONLD_EVENT_TYPE_RE = re.compile(r'"event"', re.IGNORECASE)
+
+# Parsed JSON-LD events keyed by a digest of the page HTML, so identical pages
+# (e.g. repeated Localist listings) are only parsed once per process.
+JSONLD_CACHE_SIZE = 2048
+_jsonld_cache: "OrderedDict[bytes, Optional[Dict[str, Any]]]" = OrderedDict()
+
+
+def _extract_event_from_jsonld(
+    html: str,
+    page_url: str,
+    tree: Optional[lxml.html.HtmlElement] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Extract event from JSON-LD (works for Localist, schema.org, and others).
+
+    Pass ``tree`` to reuse an already-parsed document.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
+    # Cheap scan first: most pages have no JSON-LD at all, so skip parsing
+    if "application/ld+json" not in html:
+        return None
+
+    key = hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+    if key in _jsonld_cache:
+        _jsonld_cache.move_to_end(key)
+        ev = _jsonld_cache[key]
+    else:
+        if tree is None:
+            tree = _parse_html(html)
+        ev = _parse_jsonld_event(tree) if tree is not None else None
+        _jsonld_cache[key] = ev
+        if len(_jsonld_cache) > JSONLD_CACHE_SIZE:
+            _jsonld_cache.popitem(last=False)
+
+    if ev is None:
+        return None
+    return {"source_url": page_url, **ev}
+
 
-    for sc in scripts:
-        txt = (sc.get_text() or "").strip()
-        if not txt:
+def _parse_jsonld_event(tree: lxml.html.HtmlElement) -> Optional[Dict[str, Any]]:
+    """Parse the first schema.org Event out of the page's JSON-LD blocks."""
+    for block in _JSONLD_XPATH(tree):
+        txt = str(block).strip()
+        # Organization/BreadcrumbList-only blocks can be large; skip decoding
+        # anything that can't contain an Event
+        if not txt or not _JSONLD_EVENT_TYPE_RE.search(txt):
             continue
         try:
             data = json.loads(txt)
@@ -452,13 +612,11 @@ def _extract_event_from_jsonld(html: str, page_url: str) -> Optional[Dict[str, A
 
             description = None
             if isinstance(desc, str) and desc.strip():
-                description = BeautifulSoup(desc, "html.parser").get_text(
-                    " ", strip=True
-                )
+                description = _clean_text_from_fragment(desc)
 
             return {
-                "source_url": page_url,
                 "title": title,
+                "start_dt": start_dt,
                 "start_iso": _iso_utc(start_dt),
                 "end_iso": _iso_utc(end_dt) if end_dt else None,
                 "location": (str(loc_name).strip() if loc_name else ""),
@@ -468,18 +626,38 @@ def _extract_event_from_jsonld(html: str, page_url: str) -> Optional[Dict[str, A
     return None
 
 
+def _parse_page_once(
+    html: str, base_url: str
+) -> Tuple[List[str], Optional[Dict[str, Any]], str]:
+    """
+    Parse a page a single time and derive everything the crawler needs.
+
+    Returns: (links, JSON-LD event or None, visible page text)
+    """
+    tree = _parse_html(html)
+    if tree is None:
+        return [], None, ""
+    links = _links_from_tree(tree, base_url)
+    ev = _extract_event_from_jsonld(html, base_url, tree)
+    return links, ev, _text_from_tree(tree)
+
+
 # ----------------------------
 # Gemini: confirm free food + proof
 # ----------------------------
 GEMINI_CONFIRM_PROMPT = """
-You are verifying whether an event page explicitly promises FREE food.
-
-Return ONLY valid JSON:
-{
-  "has_free_food": boolean,
-  "confidence": number (0-1),
-  "proof": string   // exact short phrase from the page proving free food (<=140 chars), empty if false
-}
+You are verifying whether event pages explicitly promise FREE food.
+The events are numbered "EVENT 1", "EVENT 2", ...
+
+Return ONLY a valid JSON array with one object per event:
+[
+  {
+    "event_index": integer,  // the EVENT number
+    "has_free_food": boolean,
+    "confidence": number (0-1),
+    "proof": string   // exact short phrase from the page proving free food (<=140 chars), empty if false
+  }
+]
 
 Rules:
 - TRUE only if explicitly free (e.g. "free food", "pizza will be provided", "free refreshments", "snacks provided for free").
@@ -487,44 +665,155 @@ Rules:
 - If it says "no food"/"food not provided", return FALSE.
 - Be reasonably lenient but require actual food mentions.
 - Extract the EXACT phrase as proof.
+- Judge each event independently.
 """
 
+# (has_free_food, confidence, proof); None when the model gave no verdict
+GeminiVerdict = Tuple[bool, float, str]
 
-def _gemini_confirm_free_food(
-    page_url: str, title: str, location: str, start_iso: str, description: str
-) -> Tuple[bool, float, str]:
-    if not client:
-        return False, 0.0, ""
 
+def _gemini_snippet(
+    page_url: str, title: str, location: str, start_iso: str, description: str
+) -> str:
     # Keep payload tiny and relevant
-    snippet = f"""URL: {page_url}
+    return f"""URL: {page_url}
 TITLE: {title}
 WHEN (UTC): {start_iso}
 WHERE: {location}
 DESCRIPTION: {description[:3000]}
 """
 
+
+async def _gemini_confirm_batch(
+    snippets: List[str],
+) -> List[Optional[GeminiVerdict]]:
+    """
+    Confirm several events with one Gemini call; one verdict per snippet.
+
+    A snippet the response does not cover gets None. Raises the last error
+    once every attempt failed, so callers never mistake it for "no food".
+    """
+    client = get_gemini_client()
+    if not client:
+        raise RuntimeError("Gemini client not configured")
+
+    contents = "\n".join(
+        f"EVENT {i}:\n{snippet}" for i, snippet in enumerate(snippets, start=1)
+    )
+
+    error: Exception = RuntimeError("Gemini not called")
     for _ in range(max(1, GEMINI_MAX_RETRIES)):
         try:
-            resp = client.models.generate_content(
+            resp = await client.aio.models.generate_content(
                 model=GEMINI_MODEL,
-                contents=[GEMINI_CONFIRM_PROMPT, snippet],
+                contents=[GEMINI_CONFIRM_PROMPT, contents],
                 config=GenerateContentConfig(
                     temperature=0.0,
                     response_mime_type="application/json",
                 ),
             )
             data = json.loads(resp.text)
-            return (
-                bool(data.get("has_free_food")),
-                float(data.get("confidence") or 0.0),
-                str(data.get("proof") or "").strip()[:140],
-            )
+            if isinstance(data, dict):
+                data = [data]
+
+            verdicts: List[Optional[GeminiVerdict]] = [None] * len(snippets)
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                idx = int(item.get("event_index") or 0) - 1
+                if 0 <= idx < len(snippets):
+                    verdicts[idx] = (
+                        bool(item.get("has_free_food")),
+                        float(item.get("confidence") or 0.0),
+                        str(item.get("proof") or "").strip()[:140],
+                    )
+            return verdicts
         except Exception as e:
             logger.warning(f"Gemini error: {e}")
-            continue
+            error = e
+
+    raise error
+
+
+class GeminiBatcher:
+    """
+    Coalesces free-food confirmations into batched Gemini requests.
+
+    Callers await ``confirm()``; a background task collects up to
+    ``max_batch`` pending snippets (or whatever arrived within ``window_ms``)
+    and resolves each caller's future from a single model call.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = GEMINI_BATCH_MAX,
+        window_ms: int = GEMINI_BATCH_WINDOW_MS,
+    ):
+        self.max_batch = max(1, max_batch)
+        self.window_s = window_ms / 1000
+        self._pending: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        self._worker = asyncio.create_task(self._run())
+        return self
 
-    return False, 0.0, ""
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._worker:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def confirm(self, snippet: str) -> Optional[GeminiVerdict]:
+        future = asyncio.get_running_loop().create_future()
+        await self._pending.put((snippet, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + self.window_s
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._pending.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Flush in the background so the next batch can start filling
+            task = asyncio.create_task(self._flush(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            verdicts = await _gemini_confirm_batch([snippet for snippet, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), verdict in zip(batch, verdicts):
+            if not future.done():
+                future.set_result(verdict)
+
+
+async def _gemini_confirm_free_food(
+    batcher: GeminiBatcher,
+    page_url: str,
+    title: str,
+    location: str,
+    start_iso: str,
+    description: str,
+) -> Optional[GeminiVerdict]:
+    snippet = _gemini_snippet(page_url, title, location, start_iso, description)
+    return await batcher.confirm(snippet)
 
 
 # ----------------------------
@@ -626,24 +915,205 @@ def get_or_create_spider_source() -> int:
         return 1
 
 
+# ----------------------------
+# Persistent page cache
+# ----------------------------
+class PageCache:
+    """
+    SQLite record of crawled pages, kept between runs.
+
+    Stores each page's validators (ETag / Last-Modified), its outgoing links
+    and its final outcome, so a re-crawl can send conditional requests and,
+    on 304, reuse the links and event without re-parsing or re-confirming.
+    Outcomes that depend on the clock (e.g. outside the lookahead window),
+    on ``min_confidence``, or on a Gemini call that failed are left unset so
+    those pages are always refetched. Writes are committed
+    every ``commit_every`` calls, so a killed crawl keeps most of its rows.
+    """
+
+    def __init__(self, path: str, commit_every: int = SPIDER_CACHE_COMMIT_EVERY):
+        self.commit_every = max(1, commit_every)
+        self._uncommitted = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                links TEXT NOT NULL,
+                outcome TEXT,
+                event TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT etag, last_modified, links, outcome, event FROM pages "
+            "WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, links, outcome, event = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "links": json.loads(links),
+            "outcome": outcome,
+            "event": json.loads(event) if event else None,
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Validators to revalidate a page whose outcome is already known."""
+        headers: Dict[str, str] = {}
+        if not entry or entry["outcome"] is None:
+            return headers
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def save_page(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        links: List[str],
+    ) -> None:
+        """Record a freshly fetched page; its outcome is set separately."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO pages "
+            "(url, etag, last_modified, links, outcome, event, fetched_at) "
+            "VALUES (?, ?, ?, ?, NULL, NULL, ?)",
+            (url, etag, last_modified, json.dumps(links), time.time()),
+        )
+        self._wrote()
+
+    def set_outcome(self, url: str, event: Optional[FreeFoodEvent]) -> None:
+        """Mark a page as having no free-food event, or as yielding ``event``."""
+        self.conn.execute(
+            "UPDATE pages SET outcome = ?, event = ? WHERE url = ?",
+            (
+                "event" if event else "none",
+                json.dumps(asdict(event)) if event else None,
+                url,
+            ),
+        )
+        self._wrote()
+
+    def _wrote(self) -> None:
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_every:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
 # ----------------------------
 # Async HTTP client with rate limiting
 # ----------------------------
+class HostThrottle:
+    """Per-host politeness: spaces requests to the same host by a minimum gap."""
+
+    def __init__(self, min_interval_s: float = DEFAULT_POLITE_DELAY_S):
+        self.min_interval_s = min_interval_s
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, url: str) -> None:
+        if self.min_interval_s <= 0:
+            return
+        host = urlparse(url).netloc
+        async with self._locks[host]:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = self._next_slot.get(host, now)
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            self._next_slot[host] = max(slot, now) + self.min_interval_s
+
+
+class PageSkipped(Exception):
+    """A response that is not downloaded: ``reason`` is "non_html" or "too_large"."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _skip_reason(response: aiohttp.ClientResponse) -> Optional[str]:
+    """Why the response should not be downloaded, judging by its headers."""
+    content_type = response.headers.get("Content-Type", "").lower()
+    if content_type and not content_type.startswith(HTML_CONTENT_TYPES):
+        return "non_html"
+    length = response.content_length
+    if length is not None and length > MAX_PAGE_BYTES:
+        return "too_large"
+    return None
+
+
+async def _read_capped(response: aiohttp.ClientResponse) -> Optional[bytes]:
+    """Read the body, or return None as soon as it exceeds MAX_PAGE_BYTES."""
+    # Chunked/streamed responses have no Content-Length to check up front
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        body += chunk
+        if len(body) > MAX_PAGE_BYTES:
+            return None
+    return bytes(body)
+
+
+def _decode_body(body: bytes, charset: Optional[str]) -> str:
+    """Decode with the Content-Type charset, falling back to UTF-8."""
+    # response.get_encoding() needs the body aiohttp buffered itself, which
+    # _read_capped bypasses, so the charset is taken from the header only.
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:  # unknown charset name
+        return body.decode("utf-8", errors="replace")
+
+
 class AsyncHttpClient:
     def __init__(
         self,
         user_agent: str = DEFAULT_USER_AGENT,
         timeout: int = DEFAULT_TIMEOUT,
         max_concurrent: int = DEFAULT_CONCURRENT_REQUESTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_retries: int = DEFAULT_HTTP_RETRIES,
+        backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
+        polite_delay_s: float = DEFAULT_POLITE_DELAY_S,
     ):
         self.user_agent = user_agent
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.pool_size = max(pool_size, max_concurrent)
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.throttle = HostThrottle(polite_delay_s)
         self.session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
         headers = {"User-Agent": self.user_agent}
-        self.session = aiohttp.ClientSession(headers=headers, timeout=self.timeout)
+        # Keep-alive pool sized for the crawl so sockets (and TLS sessions)
+        # are reused instead of re-handshaking on every request.
+        connector = aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size,
+            keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT_S,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(
+            headers=headers, timeout=self.timeout, connector=connector
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -651,20 +1121,62 @@ class AsyncHttpClient:
             await self.session.close()
 
     async def get(self, url: str) -> Tuple[Optional[str], int]:
-        """Fetch URL, return (html, status_code)."""
+        """Fetch URL, return (html, status_code). Retries transient failures."""
+        try:
+            html, status, _ = await self.fetch(url)
+        except PageSkipped:
+            return None, 200
+        return html, status
+
+    async def fetch(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[str], int, Mapping[str, str]]:
+        """
+        Fetch URL with optional extra request headers.
+
+        Returns: (html, status_code, response_headers). html is None on
+        errors and 304 Not Modified. Raises PageSkipped for non-HTML or
+        oversized responses, which are not downloaded in full.
+        """
         if not self.session:
             raise RuntimeError("Client not initialized. Use async with.")
 
-        async with self.semaphore:
-            try:
-                async with self.session.get(url) as response:
-                    if response.status >= 400:
-                        return None, response.status
-                    html = await response.text()
-                    return html, response.status
-            except Exception as e:
-                logger.debug(f"HTTP error for {url}: {e}")
-                return None, 0
+        status = 0
+        skipped: Optional[str] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff_s * (2 ** (attempt - 1)))
+            # Wait for this host's slot before taking a connection slot, so a
+            # slow host never holds up requests to other hosts.
+            await self.throttle.wait(url)
+            async with self.semaphore:
+                try:
+                    async with self.session.get(url, headers=headers) as response:
+                        status = response.status
+                        if status in RETRY_STATUS_CODES:
+                            continue
+                        if status >= 400:
+                            return None, status, {}
+                        if status == 304:
+                            return None, status, response.headers
+                        # Headers arrive before the body: bail out on
+                        # PDFs/images/huge files without downloading them.
+                        skipped = _skip_reason(response)
+                        if skipped is None:
+                            body = await _read_capped(response)
+                            if body is None:
+                                skipped = "too_large"
+                        if skipped:
+                            logger.debug(f"Skipping {url} ({skipped})")
+                            break
+                        html = _decode_body(body, response.charset)
+                        return html, status, response.headers
+                except Exception as e:
+                    logger.debug(f"HTTP error for {url} (attempt {attempt + 1}): {e}")
+                    status = 0
+        if skipped:
+            raise PageSkipped(skipped)
+        return None, status, {}
 
 
 # ----------------------------
@@ -680,6 +1192,7 @@ async def crawl_confirmed_free_food_events_async(
     restrict_to_same_site: bool = True,
     max_concurrent: int = DEFAULT_CONCURRENT_REQUESTS,
     save_to_db: bool = True,
+    cache_path: Optional[str] = SPIDER_CACHE_PATH,
 ) -> Tuple[List[Dict[str, Any]], CrawlStatistics]:
     """
     Async crawler with intelligent prioritization and multi-platform support.
@@ -689,20 +1202,107 @@ async def crawl_confirmed_free_food_events_async(
         days_lookahead: Only include events within this many days
         max_pages: Maximum pages to crawl
         max_depth: Maximum crawl depth from seed
-        polite_delay_s: Delay between requests
+        polite_delay_s: Minimum delay between requests to the same host
         min_confidence: Minimum AI confidence threshold
         restrict_to_same_site: Only crawl links on same domain
         max_concurrent: Max concurrent HTTP requests
         save_to_db: Whether to save events to database
+        cache_path: SQLite file for the cross-run page cache (None/"" disables)
 
     Returns: (events, statistics)
     """
-    if not client:
+    (result,) = await crawl_seeds_async(
+        [seed_url],
+        days_lookahead=days_lookahead,
+        max_pages=max_pages,
+        max_depth=max_depth,
+        polite_delay_s=polite_delay_s,
+        min_confidence=min_confidence,
+        restrict_to_same_site=restrict_to_same_site,
+        max_concurrent=max_concurrent,
+        save_to_db=save_to_db,
+        cache_path=cache_path,
+    )
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+async def crawl_seeds_async(
+    seed_urls: List[str],
+    days_lookahead: int = DEFAULT_DAYS_LOOKAHEAD,
+    max_pages: int = DEFAULT_MAX_PAGES,
+    max_depth: int = DEFAULT_MAX_DEPTH,
+    polite_delay_s: float = DEFAULT_POLITE_DELAY_S,
+    min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    restrict_to_same_site: bool = True,
+    max_concurrent: int = DEFAULT_CONCURRENT_REQUESTS,
+    save_to_db: bool = True,
+    cache_path: Optional[str] = SPIDER_CACHE_PATH,
+) -> List[Union[Tuple[List[Dict[str, Any]], CrawlStatistics], BaseException]]:
+    """
+    Crawl several seeds concurrently.
+
+    Seeds share one HTTP connection pool (``max_concurrent`` is process-wide),
+    one Gemini batcher and one page cache. Takes the same options as
+    crawl_confirmed_free_food_events_async.
+
+    Returns: one (events, statistics) tuple per seed, in order, or the
+    exception that seed's crawl raised.
+    """
+    if not GEMINI_API_KEY:
         raise RuntimeError("GEMINI_API_KEY not set. Needed for free-food confirmation.")
 
+    page_cache = PageCache(cache_path) if cache_path else None
+    try:
+        async with (
+            AsyncHttpClient(
+                max_concurrent=max_concurrent, polite_delay_s=polite_delay_s
+            ) as http,
+            GeminiBatcher() as gemini,
+        ):
+            return await asyncio.gather(
+                *(
+                    _crawl(
+                        seed_url=seed_url,
+                        days_lookahead=days_lookahead,
+                        max_pages=max_pages,
+                        max_depth=max_depth,
+                        min_confidence=min_confidence,
+                        restrict_to_same_site=restrict_to_same_site,
+                        save_to_db=save_to_db,
+                        http=http,
+                        gemini=gemini,
+                        page_cache=page_cache,
+                    )
+                    for seed_url in seed_urls
+                ),
+                return_exceptions=True,
+            )
+    finally:
+        if page_cache:
+            page_cache.close()
+
+
+async def _crawl(
+    seed_url: str,
+    days_lookahead: int,
+    max_pages: int,
+    max_depth: int,
+    min_confidence: float,
+    restrict_to_same_site: bool,
+    save_to_db: bool,
+    http: AsyncHttpClient,
+    gemini: GeminiBatcher,
+    page_cache: Optional[PageCache],
+) -> Tuple[List[Dict[str, Any]], CrawlStatistics]:
+    """Crawl a single seed using shared HTTP, Gemini and cache resources."""
     stats = CrawlStatistics()
-    results: Dict[str, FreeFoodEvent] = {}
-    visited: Set[str] = set()
+    # Pages are already de-duplicated by URL, so results are append-only;
+    # the id set only guards against the same event linked from two URLs.
+    results: List[FreeFoodEvent] = []
+    seen_event_ids: Set[str] = set()
+    visited: Set[int] = set()  # URL fingerprints (8 bytes each vs. full strings)
     cache: Dict[str, bool] = {}  # URL -> has_food
 
     # Get or create spider source for database
@@ -714,147 +1314,235 @@ async def crawl_confirmed_free_food_events_async(
             logger.warning(f"Could not get spider source: {e}")
 
     # Priority queue: event pages first, then others
-    priority_queue: List[Tuple[str, int]] = [(seed_url, 0)]
-    normal_queue: List[Tuple[str, int]] = []
-
-    async with AsyncHttpClient(max_concurrent=max_concurrent) as http:
-        while (priority_queue or normal_queue) and len(visited) < max_pages:
-            # Process priority queue first
-            if priority_queue:
-                url, depth = priority_queue.pop(0)
-            elif normal_queue:
-                url, depth = normal_queue.pop(0)
-            else:
-                break
-
-            if url in visited or depth > max_depth:
-                stats.pages_skipped += 1
-                continue
+    priority_queue: Deque[Tuple[str, int]] = deque([(seed_url, 0)])
+    normal_queue: Deque[Tuple[str, int]] = deque()
 
-            visited.add(url)
-            stats.pages_crawled += 1
+    confirmations: Set[asyncio.Task] = set()
 
-            # Check cache
-            if url in cache:
-                stats.cache_hits += 1
-                if not cache[url]:
-                    await asyncio.sleep(polite_delay_s)
-                    continue
+    def record_outcome(url: str, event: Optional[FreeFoodEvent] = None) -> None:
+        if page_cache:
+            page_cache.set_outcome(url, event)
 
-            # Fetch page
-            html, status = await http.get(url)
-            if html is None:
-                stats.errors["http_error"] += 1
+    def enqueue_links(links: List[str], depth: int) -> None:
+        for link in links:
+            if restrict_to_same_site and not _same_site(seed_url, link):
                 continue
-
-            # Extract links and add to appropriate queue
+            if _url_fingerprint(link) not in visited:
+                # Prioritize event pages
+                if _is_likely_event_page(link):
+                    priority_queue.append((link, depth + 1))
+                else:
+                    normal_queue.append((link, depth + 1))
+
+    async def confirm_and_record(
+        url: str,
+        platform: str,
+        title: str,
+        start_iso: str,
+        end_iso: Optional[str],
+        location: str,
+        description: str,
+        page_text: str,
+    ) -> None:
+        stats.gemini_calls += 1
+        # Errors and missing verdicts are transient: skip the page for this
+        # run but leave its outcome unset so the next run confirms it again.
+        try:
+            verdict = await _gemini_confirm_free_food(
+                gemini,
+                page_url=url,
+                title=title,
+                location=location,
+                start_iso=start_iso,
+                description=page_text if page_text else description,
+            )
+        except Exception as e:
+            stats.gemini_errors += 1
+            stats.errors["gemini"] += 1
+            logger.warning(f"Gemini error: {e}")
+            cache[url] = False
+            return
+        if verdict is None:
+            stats.gemini_errors += 1
+            stats.errors["gemini_missing_verdict"] += 1
+            cache[url] = False
+            return
+
+        has_food, conf, proof = verdict
+        if not has_food or not proof:
+            cache[url] = False
+            record_outcome(url)
+            return
+        if conf < min_confidence:
+            # Depends on this run's threshold, so it is not persisted
+            cache[url] = False
+            return
+
+        # Success! Add event
+        cache[url] = True
+
+        event_id = _stable_event_id(title, start_iso, location, url)
+        event = FreeFoodEvent(
+            source_url=url,
+            title=title,
+            start=start_iso,
+            end=end_iso,
+            location=location,
+            description=description if description else None,
+            proof=proof,
+            confidence=conf,
+            event_id=event_id,
+            platform=platform,
+        )
+        # Settle the page even when another page already yielded this event,
+        # so the next run can revalidate it instead of re-confirming it
+        record_outcome(url, event)
+        if event_id in seen_event_ids:
+            return
+        seen_event_ids.add(event_id)
+        stats.events_with_food += 1
+        results.append(event)
+
+        # Save to database
+        if save_to_db:
             try:
-                for link in _extract_links(html, url):
-                    if restrict_to_same_site and not _same_site(seed_url, link):
-                        continue
-                    if link not in visited:
-                        # Prioritize event pages
-                        if _is_likely_event_page(link):
-                            priority_queue.append((link, depth + 1))
-                        else:
-                            normal_queue.append((link, depth + 1))
+                db_id = save_event_to_database(event, source_id)
+                if db_id:
+                    stats.events_saved += 1
             except Exception as e:
-                stats.errors["link_extraction"] += 1
-                logger.debug(f"Link extraction error: {e}")
-
-            # Detect platform
-            platform = _detect_platform(url, html)
+                logger.warning(f"Failed to save event to DB: {e}")
 
-            # Extract event
-            ev = _extract_event_from_jsonld(html, url)
-            if not ev:
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
-                continue
+    # Lookahead window is fixed for the whole crawl
+    now = dt.datetime.now(UTC)
+    end_window = now + dt.timedelta(days=days_lookahead)
 
-            stats.events_found += 1
+    while (priority_queue or normal_queue) and len(visited) < max_pages:
+        # Process priority queue first
+        if priority_queue:
+            url, depth = priority_queue.popleft()
+        elif normal_queue:
+            url, depth = normal_queue.popleft()
+        else:
+            break
 
-            # Validate event
-            title = ev["title"]
-            start_iso = ev["start_iso"]
-            end_iso = ev["end_iso"]
-            location = ev["location"]
-            description = ev["description"] or ""
+        fingerprint = _url_fingerprint(url)
+        if fingerprint in visited or depth > max_depth:
+            stats.pages_skipped += 1
+            continue
 
-            if not location.strip():
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
-                continue
+        visited.add(fingerprint)
+        stats.pages_crawled += 1
 
-            if not _within_lookahead(start_iso, days_lookahead):
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
+        # Check cache
+        if url in cache:
+            stats.cache_hits += 1
+            if not cache[url]:
                 continue
 
-            # Keyword prefilter
-            page_text = _clean_text_from_html(html)
-            if not _keyword_might_have_free_food(
-                page_text
-            ) and not _keyword_might_have_free_food(description):
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
-                continue
+        # Fetch page (conditionally, if a previous run already settled it)
+        entry = page_cache.get(url) if page_cache else None
+        try:
+            html, status, headers = await http.fetch(
+                url, PageCache.conditional_headers(entry)
+            )
+        except PageSkipped as e:
+            if e.reason == "too_large":
+                stats.too_large += 1
+            else:
+                stats.skipped_non_html += 1
+            continue
 
-            # Confirm with Gemini
-            stats.gemini_calls += 1
-            try:
-                has_food, conf, proof = _gemini_confirm_free_food(
-                    page_url=url,
-                    title=title,
-                    location=location,
-                    start_iso=start_iso,
-                    description=page_text if page_text else description,
+        if status == 304 and entry:
+            # Unchanged since the last run: reuse its links and outcome
+            stats.not_modified += 1
+            enqueue_links(entry["links"], depth)
+            cached = entry["event"]
+            if (
+                cached
+                and _within_lookahead(
+                    dt.datetime.fromisoformat(cached["start"]), now, end_window
                 )
-            except Exception as e:
-                stats.gemini_errors += 1
-                stats.errors["gemini"] += 1
-                logger.warning(f"Gemini error: {e}")
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
-                continue
+                and cached["event_id"] not in seen_event_ids
+            ):
+                seen_event_ids.add(cached["event_id"])
+                results.append(FreeFoodEvent(**cached))
+                stats.events_with_food += 1
+            continue
 
-            if not has_food or conf < min_confidence or not proof:
-                cache[url] = False
-                await asyncio.sleep(polite_delay_s)
-                continue
+        if html is None:
+            stats.errors["http_error"] += 1
+            continue
+
+        # Single parse: links, JSON-LD event and visible text
+        links, ev, page_text = _parse_page_once(html, url)
+        if page_cache:
+            page_cache.save_page(
+                url, headers.get("ETag"), headers.get("Last-Modified"), links
+            )
+
+        # Add links to appropriate queue
+        try:
+            enqueue_links(links, depth)
+        except Exception as e:
+            stats.errors["link_extraction"] += 1
+            logger.debug(f"Link extraction error: {e}")
 
-            # Success! Add event
-            cache[url] = True
-            stats.events_with_food += 1
+        # Detect platform
+        platform = _detect_platform(url, html)
 
-            event_id = _stable_event_id(title, start_iso, location, url)
-            event = FreeFoodEvent(
-                source_url=url,
+        if not ev:
+            cache[url] = False
+            record_outcome(url)
+            continue
+
+        stats.events_found += 1
+
+        # Validate event
+        title = ev["title"]
+        start_iso = ev["start_iso"]
+        end_iso = ev["end_iso"]
+        location = ev["location"]
+        description = ev["description"] or ""
+
+        if not location.strip():
+            cache[url] = False
+            record_outcome(url)
+            continue
+
+        if not _within_lookahead(ev["start_dt"], now, end_window):
+            cache[url] = False
+            continue
+
+        # Keyword prefilter
+        if not _keyword_might_have_free_food(
+            page_text
+        ) and not _keyword_might_have_free_food(description):
+            cache[url] = False
+            record_outcome(url)
+            continue
+
+        # Confirm with Gemini in the background so the crawl keeps going
+        # while confirmations are coalesced into batched requests.
+        task = asyncio.create_task(
+            confirm_and_record(
+                url=url,
+                platform=platform,
                 title=title,
-                start=start_iso,
-                end=end_iso,
+                start_iso=start_iso,
+                end_iso=end_iso,
                 location=location,
-                description=description if description else None,
-                proof=proof,
-                confidence=conf,
-                event_id=event_id,
-                platform=platform,
+                description=description,
+                page_text=page_text,
             )
-            results[event_id] = event
-
-            # Save to database
-            if save_to_db:
-                try:
-                    db_id = save_event_to_database(event, source_id)
-                    if db_id:
-                        stats.events_saved += 1
-                except Exception as e:
-                    logger.warning(f"Failed to save event to DB: {e}")
+        )
+        confirmations.add(task)
+        task.add_done_callback(confirmations.discard)
 
-            await asyncio.sleep(polite_delay_s)
+    if confirmations:
+        await asyncio.gather(*confirmations)
 
     # Sort by start time
-    out = [asdict(v) for v in results.values()]
+    out = [asdict(v) for v in results]
     out.sort(key=lambda x: x["start"])
 
     logger.info(f"Crawl complete: {stats.summary()}")
@@ -865,6 +1553,14 @@ async def crawl_confirmed_free_food_events_async(
 # ----------------------------
 # Sync wrapper for backward compatibility
 # ----------------------------
+def _run(coro):
+    """Run a coroutine on uvloop when it is installed, else the default loop."""
+    if uvloop is None:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def crawl_confirmed_free_food_events(
     seed_url: str,
     days_lookahead: int = DEFAULT_DAYS_LOOKAHEAD,
@@ -875,9 +1571,10 @@ def crawl_confirmed_free_food_events(
     restrict_to_same_site: bool = True,
     max_concurrent: int = DEFAULT_CONCURRENT_REQUESTS,
     save_to_db: bool = True,
+    cache_path: Optional[str] = SPIDER_CACHE_PATH,
 ) -> List[Dict[str, Any]]:
     """Sync wrapper around async crawler."""
-    events, stats = asyncio.run(
+    events, stats = _run(
         crawl_confirmed_free_food_events_async(
             seed_url=seed_url,
             days_lookahead=days_lookahead,
@@ -888,6 +1585,7 @@ def crawl_confirmed_free_food_events(
             restrict_to_same_site=restrict_to_same_site,
             max_concurrent=max_concurrent,
             save_to_db=save_to_db,
+            cache_path=cache_path,
         )
     )
 
@@ -961,6 +1659,11 @@ Examples:
         action="store_true",
         help="Don't save events to database",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the on-disk page cache from previous runs",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -1012,23 +1715,33 @@ Examples:
     print(f"{'=' * 60}\n")
 
     all_events = []
+    seeds = [seed.strip() for seed in seed_urls]
 
-    for seed in seed_urls:
+    # Seeds usually live on independent hosts, so crawl them concurrently
+    for seed in seeds:
         print(f"\n🔍 Crawling: {seed}")
-        try:
-            events = crawl_confirmed_free_food_events(
-                seed_url=seed.strip(),
-                days_lookahead=args.days,
-                max_pages=args.max_pages,
-                max_depth=args.max_depth,
-                min_confidence=args.min_confidence,
-                restrict_to_same_site=True,
-                max_concurrent=args.concurrent,
-                save_to_db=not args.no_db,
-            )
-            all_events.extend(events)
-        except Exception as e:
-            logger.error(f"Error crawling {seed}: {e}")
+    results = _run(
+        crawl_seeds_async(
+            seeds,
+            days_lookahead=args.days,
+            max_pages=args.max_pages,
+            max_depth=args.max_depth,
+            min_confidence=args.min_confidence,
+            restrict_to_same_site=True,
+            max_concurrent=args.concurrent,
+            save_to_db=not args.no_db,
+            cache_path=None if args.no_cache else SPIDER_CACHE_PATH,
+        )
+    )
+
+    for seed, result in zip(seeds, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Error crawling {seed}: {result}")
+            continue
+        events, stats = result
+        print(f"\nCrawl Statistics ({seed}):")
+        print(json.dumps(stats.summary(), indent=2))
+        all_events.extend(events)
 
     print(f"\n{'=' * 60}")
     print(f"Found {len(all_events)} confirmed free food events")
@@ -1,16 +1,21 @@
 """Simple subscription API to manage email subscriptions."""
 
+import json
 import os
-from typing import List
+from typing import Iterator, List
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from services.database import (
     add_user,
+    add_users_bulk,
+    count_active_users,
     deactivate_user,
     get_active_users,
     init_db,
+    iter_active_users_sorted,
 )
 
 app = FastAPI(title="WTF Subscription API")
@@ -61,14 +66,7 @@ async def subscribe(subscription: EmailSubscription):
 @app.post("/subscribe/bulk", status_code=201)
 async def subscribe_bulk(subscription: BulkEmailSubscription):
     """Subscribe multiple emails at once."""
-    added = []
-    already_subscribed = []
-
-    for email in subscription.emails:
-        if add_subscriber(email):
-            added.append(email)
-        else:
-            already_subscribed.append(email)
+    added, already_subscribed = add_users_bulk(subscription.emails)
 
     return {
         "message": f"Subscribed {len(added)} email(s)",
@@ -86,11 +84,21 @@ async def unsubscribe(subscription: EmailSubscription):
         raise HTTPException(status_code=404, detail="Email not found")
 
 
+def _stream_subscribers_json(count: int) -> Iterator[str]:
+    """Render {"count": ..., "subscribers": [...]} incrementally."""
+    yield f'{{"count": {count}, "subscribers": ['
+    for i, email in enumerate(iter_active_users_sorted()):
+        yield ("," if i else "") + json.dumps(email)
+    yield "]}"
+
+
 @app.get("/subscribers")
 async def list_subscribers():
-    """List all active subscribers."""
-    subscribers = get_subscribers()
-    return {"count": len(subscribers), "subscribers": sorted(list(subscribers))}
+    """List all active subscribers (sorted in SQL and streamed)."""
+    return StreamingResponse(
+        _stream_subscribers_json(count_active_users()),
+        media_type="application/json",
+    )
 
 
 @app.get("/")
@@ -103,13 +111,13 @@ async def root():
 async def health():
     """Health check endpoint for Docker."""
     try:
-        # Test database connection
-        subscribers = get_subscribers()
+        # Test database connection with a cheap COUNT instead of loading
+        # (and caching) every subscriber email
         return {
             "status": "healthy",
             "service": "WTF Subscription API",
             "database": "connected",
-            "subscribers": len(subscribers),
+            "subscribers": count_active_users(),
         }
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
@@ -1,12 +1,29 @@
 """Supabase client for WTF application."""
 
+import asyncio
+import copy
+import functools
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
+import httpx
 from postgrest.exceptions import APIError
+from redis import Redis
 
-from supabase import Client, create_client  # type: ignore[attr-defined]
+from supabase import (  # type: ignore[attr-defined]
+    AsyncClient,
+    AsyncClientOptions,
+    Client,
+    ClientOptions,
+    create_async_client,
+    create_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +41,67 @@ if SUPABASE_URL and SUPABASE_URL.startswith("postgresql://"):
     )
     SUPABASE_URL = ""  # Clear invalid URL
 
-# Global Supabase client
+# Global Supabase clients (one pooled HTTP connection set per process)
 _supabase: Optional[Client] = None
+_anon_supabase: Optional[Client] = None
+_client_lock = threading.Lock()
+
+# Async client, bound to the event loop that created it
+_async_supabase: Optional[Tuple[asyncio.AbstractEventLoop, AsyncClient]] = None
+
+SUPABASE_MAX_CONNECTIONS = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "50"))
+SUPABASE_MAX_KEEPALIVE = int(os.getenv("SUPABASE_MAX_KEEPALIVE", "20"))
+SUPABASE_CONNECT_TIMEOUT_S = float(os.getenv("SUPABASE_CONNECT_TIMEOUT_S", "2"))
+SUPABASE_READ_TIMEOUT_S = float(os.getenv("SUPABASE_READ_TIMEOUT_S", "30"))
+# Multiplex concurrent requests over one connection (h2 ships with postgrest)
+SUPABASE_HTTP2 = os.getenv("SUPABASE_HTTP2", "true").lower() in ["1", "true", "yes"]
+
+# In-process cache for the active subscriber list (bursts of notifications
+# collapse to one RPC per TTL window)
+ACTIVE_USERS_CACHE_TTL = int(os.getenv("CACHE_ACTIVE_USERS_TTL", "30"))
+_active_users_cache: Optional[Tuple[float, List[str]]] = None
+_active_users_lock = threading.Lock()
+
+# Stats are for dashboards, not real-time; reuse them for a short TTL
+STATS_CACHE_TTL = int(os.getenv("CACHE_STATS_TTL", "30"))
+_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_stats_lock = threading.Lock()
+
+# Event sources / categories are small reference tables that rarely change
+REFERENCE_CACHE_TTL = int(os.getenv("CACHE_REFERENCE_TTL", "300"))
+_sources_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+_categories_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+_reference_lock = threading.Lock()
+
+# Runs the independent fallback count queries concurrently
+_count_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="supabase-count")
+
+# Per-user notification inboxes are cached in Redis (shared across workers)
+NOTIFICATIONS_CACHE_TTL = int(os.getenv("CACHE_NOTIFICATIONS_TTL", "30"))
+
+# Failures swallowed by @safe_db, per function name
+db_error_counts: Counter = Counter()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _client_options() -> ClientOptions:
+    """Client options with a pooled keep-alive httpx client."""
+    http_client = httpx.Client(
+        http2=SUPABASE_HTTP2,
+        limits=httpx.Limits(
+            max_connections=SUPABASE_MAX_CONNECTIONS,
+            max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+        ),
+        timeout=httpx.Timeout(
+            SUPABASE_READ_TIMEOUT_S, connect=SUPABASE_CONNECT_TIMEOUT_S
+        ),
+    )
+    return ClientOptions(httpx_client=http_client)
 
 
 def get_supabase_client() -> Client:
-    """Get or create Supabase client instance."""
+    """Get or create the shared Supabase client instance."""
     global _supabase
 
     if _supabase is None:
@@ -38,20 +110,109 @@ def get_supabase_client() -> Client:
                 "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment"
             )
 
-        _supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
-        logger.info("✅ Supabase client initialized")
+        with _client_lock:
+            if _supabase is None:
+                _supabase = create_client(
+                    SUPABASE_URL, SUPABASE_KEY, options=_client_options()
+                )
+                logger.info("✅ Supabase client initialized")
 
     return _supabase
 
 
-def get_anon_client() -> Client:
-    """Get Supabase client with anonymous key (for public access)."""
-    if not SUPABASE_URL or not SUPABASE_ANON_KEY:
-        raise ValueError(
-            "SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment"
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client for the running event loop.
+
+    httpx async connections belong to one loop, so a new client (and pool)
+    is built when called from a different loop, e.g. per asyncio.run().
+    """
+    global _async_supabase
+
+    loop = asyncio.get_running_loop()
+    if _async_supabase is None or _async_supabase[0] is not loop:
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            raise ValueError(
+                "SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY must be set in environment"
+            )
+
+        http_client = httpx.AsyncClient(
+            http2=SUPABASE_HTTP2,
+            limits=httpx.Limits(
+                max_connections=SUPABASE_MAX_CONNECTIONS,
+                max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+            ),
+            timeout=httpx.Timeout(
+                SUPABASE_READ_TIMEOUT_S, connect=SUPABASE_CONNECT_TIMEOUT_S
+            ),
         )
+        client = await create_async_client(
+            SUPABASE_URL,
+            SUPABASE_KEY,
+            options=AsyncClientOptions(httpx_client=http_client),
+        )
+        _async_supabase = (loop, client)
+        logger.info("✅ Async Supabase client initialized")
+
+    return _async_supabase[1]
+
 
-    return create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+def get_anon_client() -> Client:
+    """Get the shared Supabase client with anonymous key (for public access)."""
+    global _anon_supabase
+
+    if _anon_supabase is None:
+        if not SUPABASE_URL or not SUPABASE_ANON_KEY:
+            raise ValueError(
+                "SUPABASE_URL and SUPABASE_ANON_KEY must be set in environment"
+            )
+
+        with _client_lock:
+            if _anon_supabase is None:
+                _anon_supabase = create_client(
+                    SUPABASE_URL, SUPABASE_ANON_KEY, options=_client_options()
+                )
+
+    return _anon_supabase
+
+
+def _db_failure(fn: Callable[..., Any], error: Exception, default: Any) -> Any:
+    db_error_counts[fn.__name__] += 1
+    logger.error(f"Error in {fn.__name__}: {error}")
+    # Copy so callers can't mutate the shared default list/dict
+    return copy.copy(default)
+
+
+def safe_db(default: Any) -> Callable[[F], F]:
+    """
+    Log and swallow any exception from a database helper, returning ``default``.
+
+    Works on sync and async functions. Failures are counted per function in
+    ``db_error_counts``.
+    """
+
+    def decorator(fn: F) -> F:
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    return _db_failure(fn, e, default)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                return _db_failure(fn, e, default)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
 
 
 # ============================================
@@ -59,6 +220,7 @@ def get_anon_client() -> Client:
 # ============================================
 
 
+@safe_db(None)
 def add_user_subscription(email: str) -> Optional[Dict[str, Any]]:
     """
     Subscribe a user (sign them up via Supabase Auth).
@@ -66,112 +228,99 @@ def add_user_subscription(email: str) -> Optional[Dict[str, Any]]:
     Note: This should typically be done via Supabase Auth signup flow.
     This function is for backend-initiated subscriptions.
     """
-    try:
-        supabase = get_supabase_client()
-
-        # Check if user already exists
-        existing = (
-            supabase.table("user_profiles")
-            .select("id, email")
-            .eq("email", email)
-            .execute()
-        )
+    supabase = get_supabase_client()
 
-        if existing.data:
-            logger.info(f"User {email} already subscribed")
-            return existing.data[0]
+    # Check if user already exists
+    existing = (
+        supabase.table("user_profiles").select("id, email").eq("email", email).execute()
+    )
 
-        # For backend subscription, we need to create auth user first
-        # This uses admin API (service role key required)
-        auth_response = supabase.auth.admin.create_user({"email": email})
+    if existing.data:
+        logger.info(f"User {email} already subscribed")
+        return existing.data[0]
 
-        if auth_response.user:
-            logger.info(f"✅ User {email} subscribed successfully")
-            return {"id": auth_response.user.id, "email": email}
-        else:
-            logger.error(f"Failed to create user {email}")
-            return None
+    # For backend subscription, we need to create auth user first
+    # This uses admin API (service role key required)
+    auth_response = supabase.auth.admin.create_user({"email": email})
 
-    except APIError as e:
-        logger.error(f"Supabase API error subscribing {email}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Error subscribing {email}: {e}")
+    if auth_response.user:
+        invalidate_users_cache()
+        logger.info(f"✅ User {email} subscribed successfully")
+        return {"id": auth_response.user.id, "email": email}
+    else:
+        logger.error(f"Failed to create user {email}")
         return None
 
 
+@safe_db(None)
 def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
     """Get user profile by email."""
-    try:
-        supabase = get_supabase_client()
-        response = (
-            supabase.table("user_profiles")
-            .select("*")
-            .eq("email", email)
-            .single()
-            .execute()
-        )
-        return response.data if response.data else None
-    except Exception as e:
-        logger.error(f"Error fetching user {email}: {e}")
-        return None
+    supabase = get_supabase_client()
+    response = (
+        supabase.table("user_profiles")
+        .select("*")
+        .eq("email", email)
+        .single()
+        .execute()
+    )
+    return response.data if response.data else None
 
 
+@safe_db([])
 def get_active_users() -> List[str]:
-    """Get all active user emails (for notifications)."""
-    try:
+    """Get all active user emails (for notifications), cached for a short TTL."""
+    global _active_users_cache
+
+    with _active_users_lock:
+        cached = _active_users_cache
+        if cached and time.monotonic() - cached[0] < ACTIVE_USERS_CACHE_TTL:
+            return list(cached[1])
+
         supabase = get_supabase_client()
 
         # Use the helper function we created
         response = supabase.rpc("get_active_subscribers").execute()
 
-        if response.data:
-            # Return list of emails
-            return [user["email"] for user in response.data]
-        return []
+        # Return list of emails
+        emails = [user["email"] for user in response.data or []]
 
-    except Exception as e:
-        logger.error(f"Error fetching active users: {e}")
-        return []
+        _active_users_cache = (time.monotonic(), emails)
+        return list(emails)
 
 
+@safe_db(False)
 def deactivate_user(email: str) -> bool:
     """Deactivate a user subscription."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
+
+    # Update user profile to disable notifications
+    response = (
+        supabase.table("user_profiles")
+        .update({"notification_enabled": False})
+        .eq("email", email)
+        .execute()
+    )
 
-        # Update user profile to disable notifications
-        response = (
-            supabase.table("user_profiles")
-            .update({"notification_enabled": False})
-            .eq("email", email)
-            .execute()
-        )
-
-        return len(response.data) > 0
-    except Exception as e:
-        logger.error(f"Error deactivating user {email}: {e}")
-        return False
+    if response.data:
+        invalidate_users_cache()
+    return len(response.data) > 0
 
 
+@safe_db(None)
 def update_user_preferences(
     user_id: str, preferences: Dict[str, Any]
 ) -> Optional[Dict[str, Any]]:
     """Update user notification preferences."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        response = (
-            supabase.table("user_preferences")
-            .update(preferences)
-            .eq("user_id", user_id)
-            .execute()
-        )
+    response = (
+        supabase.table("user_preferences")
+        .update(preferences)
+        .eq("user_id", user_id)
+        .execute()
+    )
 
-        return response.data[0] if response.data else None
-    except Exception as e:
-        logger.error(f"Error updating preferences for user {user_id}: {e}")
-        return None
+    return response.data[0] if response.data else None
 
 
 # ============================================
@@ -179,6 +328,7 @@ def update_user_preferences(
 # ============================================
 
 
+@safe_db(None)
 def add_event(
     title: str,
     description: str,
@@ -190,119 +340,98 @@ def add_event(
     **kwargs,
 ) -> Optional[Dict[str, Any]]:
     """Add a new event to the database."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        event_data = {
-            "title": title,
-            "description": description,
-            "location": location,
-            "event_date": event_date,
-            "source_id": source_id,
-            "has_free_food": has_free_food,
-            "confidence_score": confidence_score,
-            **kwargs,
-        }
+    event_data = {
+        "title": title,
+        "description": description,
+        "location": location,
+        "event_date": event_date,
+        "source_id": source_id,
+        "has_free_food": has_free_food,
+        "confidence_score": confidence_score,
+        **kwargs,
+    }
 
-        response = supabase.table("events").insert(event_data).execute()
-        return response.data[0] if response.data else None
-    except Exception as e:
-        logger.error(f"Error adding event: {e}")
-        return None
+    response = supabase.table("events").insert(event_data).execute()
+    return response.data[0] if response.data else None
 
 
+@safe_db(None)
 def get_event(event_id: int) -> Optional[Dict[str, Any]]:
     """Get event by ID."""
-    try:
-        supabase = get_supabase_client()
-        response = (
-            supabase.table("events").select("*").eq("id", event_id).single().execute()
-        )
-        return response.data if response.data else None
-    except Exception as e:
-        logger.error(f"Error fetching event {event_id}: {e}")
-        return None
+    supabase = get_supabase_client()
+    response = (
+        supabase.table("events").select("*").eq("id", event_id).single().execute()
+    )
+    return response.data if response.data else None
 
 
+@safe_db([])
 def get_events(
     limit: int = 100,
     has_free_food: Optional[bool] = None,
     notification_sent: Optional[bool] = None,
 ) -> List[Dict[str, Any]]:
     """Get events with optional filters."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        query = supabase.table("events").select("*")
+    query = supabase.table("events").select("*")
 
-        if has_free_food is not None:
-            query = query.eq("has_free_food", has_free_food)
+    if has_free_food is not None:
+        query = query.eq("has_free_food", has_free_food)
 
-        if notification_sent is not None:
-            query = query.eq("notification_sent", notification_sent)
+    if notification_sent is not None:
+        query = query.eq("notification_sent", notification_sent)
 
-        response = query.order("event_date", desc=True).limit(limit).execute()
+    response = query.order("event_date", desc=True).limit(limit).execute()
 
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error fetching events: {e}")
-        return []
+    return response.data if response.data else []
 
 
+@safe_db([])
 def get_recent_food_events(days: int = 1, limit: int = 50) -> List[Dict[str, Any]]:
     """Get recent free food events using the view."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        # Use the view we created
-        response = (
-            supabase.table("v_recent_food_events").select("*").limit(limit).execute()
-        )
+    # Use the view we created
+    response = supabase.table("v_recent_food_events").select("*").limit(limit).execute()
 
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error fetching recent food events: {e}")
-        return []
+    return response.data if response.data else []
 
 
+@safe_db(False)
 def mark_event_notified(event_id: int, notification_count: int = 0) -> bool:
     """Mark an event as notified."""
-    try:
-        supabase = get_supabase_client()
-
-        response = (
-            supabase.table("events")
-            .update(
-                {
-                    "notification_sent": True,
-                    "notification_sent_at": "now()",
-                    "notification_count": notification_count,
-                }
-            )
-            .eq("id", event_id)
-            .execute()
+    supabase = get_supabase_client()
+
+    response = (
+        supabase.table("events")
+        .update(
+            {
+                "notification_sent": True,
+                "notification_sent_at": "now()",
+                "notification_count": notification_count,
+            }
         )
+        .eq("id", event_id)
+        .execute()
+    )
 
-        return len(response.data) > 0
-    except Exception as e:
-        logger.error(f"Error marking event {event_id} as notified: {e}")
-        return False
+    return len(response.data) > 0
 
 
+@safe_db([])
 def search_events(query: str, limit: int = 20) -> List[Dict[str, Any]]:
     """Full-text search for events."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        # Use the search function we created
-        response = supabase.rpc(
-            "search_events", {"search_query": query, "limit_count": limit}
-        ).execute()
+    # Use the search function we created
+    response = supabase.rpc(
+        "search_events", {"search_query": query, "limit_count": limit}
+    ).execute()
 
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error searching events: {e}")
-        return []
+    return response.data if response.data else []
 
 
 # ============================================
@@ -310,6 +439,46 @@ def search_events(query: str, limit: int = 20) -> List[Dict[str, Any]]:
 # ============================================
 
 
+def _notification_record(
+    user_id: str,
+    event_id: int,
+    channel: str = "email",
+    email_subject: Optional[str] = None,
+    **kwargs,
+) -> Dict[str, Any]:
+    return {
+        "user_id": user_id,
+        "event_id": event_id,
+        "channel": channel,
+        "status": "pending",
+        "email_subject": email_subject,
+        **kwargs,
+    }
+
+
+# Extra columns the insert_notification() SQL function accepts via ``extras``
+_INSERT_NOTIFICATION_EXTRAS = frozenset(
+    {"status", "email_message_id", "error_message", "retry_count", "next_retry_at"}
+)
+
+
+def _insert_notification_params(
+    user_id: str,
+    event_id: int,
+    channel: str,
+    email_subject: Optional[str],
+    extras: Dict[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "user_id_param": user_id,
+        "event_id_param": event_id,
+        "channel_param": channel,
+        "email_subject_param": email_subject,
+        "extras": extras,
+    }
+
+
+@safe_db(None)
 def add_notification(
     user_id: str,
     event_id: int,
@@ -317,64 +486,220 @@ def add_notification(
     email_subject: Optional[str] = None,
     **kwargs,
 ) -> Optional[Dict[str, Any]]:
-    """Add a notification record."""
-    try:
-        supabase = get_supabase_client()
+    """
+    Add a notification record.
 
-        notification_data = {
-            "user_id": user_id,
-            "event_id": event_id,
-            "channel": channel,
-            "status": "pending",
-            "email_subject": email_subject,
-            **kwargs,
-        }
+    Goes through the insert_notification() SQL function (cached plan) when
+    the extra columns allow it, else a plain PostgREST insert.
+    """
+    supabase = get_supabase_client()
 
-        response = supabase.table("notifications").insert(notification_data).execute()
-        return response.data[0] if response.data else None
-    except Exception as e:
-        logger.error(f"Error adding notification: {e}")
-        return None
+    if _INSERT_NOTIFICATION_EXTRAS.issuperset(kwargs):
+        try:
+            params = _insert_notification_params(
+                user_id, event_id, channel, email_subject, kwargs
+            )
+            response = supabase.rpc("insert_notification", params).execute()
+            invalidate_notifications_cache(user_id)
+            return response.data or None
+        except APIError as e:
+            # PGRST202: function not found (migration not applied)
+            if e.code != "PGRST202":
+                raise
+
+    notification_data = _notification_record(
+        user_id, event_id, channel, email_subject, **kwargs
+    )
+
+    response = supabase.table("notifications").insert(notification_data).execute()
+    invalidate_notifications_cache(user_id)
+    return response.data[0] if response.data else None
+
+
+def record_notification(
+    user_id: str,
+    event_id: int,
+    status: str,
+    channel: str = "email",
+    email_subject: Optional[str] = None,
+    **kwargs,
+) -> Optional[Dict[str, Any]]:
+    """
+    Record an already-attempted notification with its final status.
+
+    One insert instead of add_notification() + update_notification_status()
+    for the common path where delivery is attempted before the record is
+    written. Keep the two-step API when the row must exist before sending.
+    """
+    return add_notification(
+        user_id, event_id, channel, email_subject, status=status, **kwargs
+    )
+
+
+@safe_db([])
+def add_notifications_bulk(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Insert many notification records in a single request.
+
+    Each record takes the same fields as add_notification's arguments
+    (user_id, event_id, optional channel/email_subject/extra columns).
+    """
+    if not records:
+        return []
+
+    supabase = get_supabase_client()
+
+    rows = [_notification_record(**record) for record in records]
+    response = supabase.table("notifications").insert(rows).execute()
+    invalidate_notifications_cache(*(row["user_id"] for row in rows))
+    return response.data if response.data else []
+
+
+@safe_db(None)
+async def add_notification_async(
+    user_id: str,
+    event_id: int,
+    channel: str = "email",
+    email_subject: Optional[str] = None,
+    **kwargs,
+) -> Optional[Dict[str, Any]]:
+    """Async add_notification; many can be awaited together with gather()."""
+    supabase = await get_async_supabase_client()
+
+    if _INSERT_NOTIFICATION_EXTRAS.issuperset(kwargs):
+        try:
+            params = _insert_notification_params(
+                user_id, event_id, channel, email_subject, kwargs
+            )
+            response = await supabase.rpc("insert_notification", params).execute()
+            await asyncio.to_thread(invalidate_notifications_cache, user_id)
+            return response.data or None
+        except APIError as e:
+            # PGRST202: function not found (migration not applied)
+            if e.code != "PGRST202":
+                raise
+
+    notification_data = _notification_record(
+        user_id, event_id, channel, email_subject, **kwargs
+    )
+
+    response = await supabase.table("notifications").insert(notification_data).execute()
+    # Redis client is sync; keep it off the event loop
+    await asyncio.to_thread(invalidate_notifications_cache, user_id)
+    return response.data[0] if response.data else None
+
+
+@safe_db([])
+async def add_notifications_bulk_async(
+    records: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Async add_notifications_bulk."""
+    if not records:
+        return []
 
+    supabase = await get_async_supabase_client()
 
+    rows = [_notification_record(**record) for record in records]
+    response = await supabase.table("notifications").insert(rows).execute()
+    await asyncio.to_thread(
+        invalidate_notifications_cache, *(row["user_id"] for row in rows)
+    )
+    return response.data if response.data else []
+
+
+@safe_db(False)
 def update_notification_status(notification_id: int, status: str, **kwargs) -> bool:
     """Update notification status (sent, delivered, opened, etc.)."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        update_data = {"status": status, **kwargs}
+    update_data = {"status": status, **kwargs}
 
-        response = (
-            supabase.table("notifications")
-            .update(update_data)
-            .eq("id", notification_id)
-            .execute()
-        )
+    response = (
+        supabase.table("notifications")
+        .update(update_data)
+        .eq("id", notification_id)
+        .execute()
+    )
+
+    invalidate_notifications_cache(*(row.get("user_id") for row in response.data))
+    return len(response.data) > 0
+
+
+@safe_db(0)
+def update_notifications_status(
+    notification_ids: List[int], status: str, **kwargs
+) -> int:
+    """Set the same status on many notifications; returns rows updated."""
+    if not notification_ids:
+        return 0
+
+    supabase = get_supabase_client()
+
+    update_data = {"status": status, **kwargs}
+
+    response = (
+        supabase.table("notifications")
+        .update(update_data)
+        .in_("id", notification_ids)
+        .execute()
+    )
+
+    invalidate_notifications_cache(*(row.get("user_id") for row in response.data))
+    return len(response.data)
+
+
+def _redis_client() -> Redis:
+    """Redis client on the shared message-queue connection pool."""
+    from services.mq import get_redis_pool
+
+    return Redis(connection_pool=get_redis_pool())
 
-        return len(response.data) > 0
-    except Exception as e:
-        logger.error(f"Error updating notification {notification_id}: {e}")
-        return False
 
+def _notif_cache_key(user_id: str) -> str:
+    # One hash per user (field = limit) so a write invalidates every page size
+    return f"notifications:{user_id}"
 
+
+@safe_db([])
 def get_user_notifications(user_id: str, limit: int = 50) -> List[Dict[str, Any]]:
-    """Get notifications for a user."""
+    """Get notifications for a user (cached in Redis for a few seconds)."""
+    key = _notif_cache_key(user_id)
     try:
-        supabase = get_supabase_client()
+        cached = _redis_client().hget(key, str(limit))
+        if cached is not None:
+            return json.loads(cached)
+    except Exception as e:
+        logger.debug(f"Notifications cache read failed for user {user_id}: {e}")
 
-        response = (
-            supabase.table("notifications")
-            .select("*")
-            .eq("user_id", user_id)
-            .order("sent_at", desc=True)
-            .limit(limit)
-            .execute()
-        )
+    supabase = get_supabase_client()
+
+    response = (
+        supabase.table("notifications")
+        .select("*")
+        .eq("user_id", user_id)
+        .order("sent_at", desc=True)
+        .limit(limit)
+        .execute()
+    )
+
+    notifications = response.data if response.data else []
 
-        return response.data if response.data else []
+    try:
+        redis = _redis_client()
+        pipe = redis.pipeline()
+        pipe.hset(key, str(limit), json.dumps(notifications))
+        pipe.expire(key, NOTIFICATIONS_CACHE_TTL)
+        errors = [
+            r for r in pipe.execute(raise_on_error=False) if isinstance(r, Exception)
+        ]
+        if errors:
+            # Never leave the hash behind without a TTL
+            redis.delete(key)
+            raise errors[0]
     except Exception as e:
-        logger.error(f"Error fetching notifications for user {user_id}: {e}")
-        return []
+        logger.debug(f"Notifications cache write failed for user {user_id}: {e}")
+
+    return notifications
 
 
 # ============================================
@@ -382,9 +707,14 @@ def get_user_notifications(user_id: str, limit: int = 50) -> List[Dict[str, Any]
 # ============================================
 
 
+@safe_db([])
 def get_event_sources(active_only: bool = True) -> List[Dict[str, Any]]:
-    """Get event sources."""
-    try:
+    """Get event sources (cached for a TTL, per ``active_only``)."""
+    with _reference_lock:
+        cached = _sources_cache.get(active_only)
+        if cached and time.monotonic() - cached[0] < REFERENCE_CACHE_TTL:
+            return list(cached[1])
+
         supabase = get_supabase_client()
 
         query = supabase.table("event_sources").select("*")
@@ -393,15 +723,20 @@ def get_event_sources(active_only: bool = True) -> List[Dict[str, Any]]:
             query = query.eq("is_active", True)
 
         response = query.order("priority", desc=True).execute()
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error fetching event sources: {e}")
-        return []
+        sources = response.data if response.data else []
+
+        _sources_cache[active_only] = (time.monotonic(), sources)
+        return list(sources)
 
 
+@safe_db([])
 def get_event_categories(active_only: bool = True) -> List[Dict[str, Any]]:
-    """Get event categories."""
-    try:
+    """Get event categories (cached for a TTL, per ``active_only``)."""
+    with _reference_lock:
+        cached = _categories_cache.get(active_only)
+        if cached and time.monotonic() - cached[0] < REFERENCE_CACHE_TTL:
+            return list(cached[1])
+
         supabase = get_supabase_client()
 
         query = supabase.table("event_categories").select("*")
@@ -410,10 +745,10 @@ def get_event_categories(active_only: bool = True) -> List[Dict[str, Any]]:
             query = query.eq("is_active", True)
 
         response = query.order("display_order").execute()
-        return response.data if response.data else []
-    except Exception as e:
-        logger.error(f"Error fetching event categories: {e}")
-        return []
+        categories = response.data if response.data else []
+
+        _categories_cache[active_only] = (time.monotonic(), categories)
+        return list(categories)
 
 
 # ============================================
@@ -421,54 +756,88 @@ def get_event_categories(active_only: bool = True) -> List[Dict[str, Any]]:
 # ============================================
 
 
-def get_stats() -> Dict[str, Any]:
-    """Get database statistics."""
-    try:
-        supabase = get_supabase_client()
+def _count_rows(supabase: Client, table: str, **filters: Any) -> int:
+    """Exact row count via a HEAD request (Content-Range only, no rows)."""
+    query = supabase.table(table).select("id", count="exact", head=True)
+    for column, value in filters.items():
+        query = query.eq(column, value)
+    return query.execute().count or 0
 
-        # Get counts using simple queries
-        events_response = supabase.table("events").select("id", count="exact").execute()
 
-        food_events_response = (
-            supabase.table("events")
-            .select("id", count="exact")
-            .eq("has_free_food", True)
-            .execute()
-        )
+def _stats_from_counts(supabase: Client) -> Dict[str, int]:
+    # Independent queries: latency is the slowest one, not the sum of three
+    # (the shared httpx pool is thread-safe)
+    total = _count_executor.submit(_count_rows, supabase, "events")
+    food = _count_executor.submit(_count_rows, supabase, "events", has_free_food=True)
+    users = _count_executor.submit(
+        _count_rows, supabase, "user_profiles", notification_enabled=True
+    )
+    return {
+        "total_events": total.result(),
+        "food_events": food.result(),
+        "active_users": users.result(),
+    }
 
-        users_response = (
-            supabase.table("user_profiles")
-            .select("id", count="exact")
-            .eq("notification_enabled", True)
-            .execute()
-        )
 
-        return {
-            "total_events": events_response.count or 0,
-            "food_events": food_events_response.count or 0,
-            "active_users": users_response.count or 0,
-        }
-    except Exception as e:
-        logger.error(f"Error fetching stats: {e}")
-        return {
-            "total_events": 0,
-            "food_events": 0,
-            "active_users": 0,
+@safe_db({"total_events": 0, "food_events": 0, "active_users": 0})
+def get_stats() -> Dict[str, Any]:
+    """Get database statistics (one RPC round-trip, cached for a short TTL)."""
+    global _stats_cache
+
+    with _stats_lock:
+        cached = _stats_cache
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return dict(cached[1])
+
+        supabase = get_supabase_client()
+
+        try:
+            # All three counts come from the get_stats() SQL function
+            response = supabase.rpc("get_stats").execute()
+            data = response.data or {}
+        except APIError as e:
+            # PGRST202: function not found (stats migration not applied)
+            if e.code != "PGRST202":
+                raise
+            data = _stats_from_counts(supabase)
+
+        stats = {
+            "total_events": data.get("total_events") or 0,
+            "food_events": data.get("food_events") or 0,
+            "active_users": data.get("active_users") or 0,
         }
 
+        _stats_cache = (time.monotonic(), stats)
+        return dict(stats)
+
 
 # ============================================
-# Helper: Invalidate cache (for compatibility)
+# Helper: Invalidate caches
 # ============================================
 
 
 def invalidate_users_cache():
-    """
-    Invalidate users cache.
-
-    Note: With Supabase, we don't need Redis caching for users
-    because Supabase has built-in caching and is fast enough.
-    This function is kept for compatibility with existing code.
-    """
-    logger.info("Cache invalidation called (no-op with Supabase)")
-    pass
+    """Invalidate the in-process active users cache."""
+    global _active_users_cache
+    with _active_users_lock:
+        _active_users_cache = None
+    logger.info("Active users cache invalidated")
+
+
+def invalidate_sources_cache():
+    """Invalidate the cached event sources and categories (after admin edits)."""
+    with _reference_lock:
+        _sources_cache.clear()
+        _categories_cache.clear()
+    logger.info("Event sources/categories cache invalidated")
+
+
+def invalidate_notifications_cache(*user_ids: Optional[str]) -> None:
+    """Drop the cached notification inboxes of the given users."""
+    keys = {_notif_cache_key(user_id) for user_id in user_ids if user_id}
+    if not keys:
+        return
+    try:
+        _redis_client().delete(*keys)
+    except Exception as e:
+        logger.debug(f"Notifications cache invalidation failed: {e}")
@@ -0,0 +1,22 @@
+-- ============================================
+-- Stats Function
+-- Single round-trip for dashboard / API statistics
+-- Migration: 20250101000005
+-- ============================================
+
+-- Function: Event and subscriber counts in one call
+CREATE OR REPLACE FUNCTION public.get_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_events', (SELECT COUNT(*) FROM public.events),
+        'food_events', (SELECT COUNT(*) FROM public.events WHERE has_free_food = TRUE),
+        'active_users', (SELECT COUNT(*) FROM public.user_profiles WHERE notification_enabled = TRUE)
+    );
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION public.get_stats IS 'Returns total_events, food_events and active_users counts as JSON';
+
+-- SECURITY DEFINER bypasses RLS: functions are executable by PUBLIC (and
+-- Supabase grants anon/authenticated directly), so restrict it to the backend
+REVOKE EXECUTE ON FUNCTION public.get_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_stats TO service_role;
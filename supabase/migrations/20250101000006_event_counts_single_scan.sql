@@ -0,0 +1,34 @@
+-- ============================================
+-- Event Counts (single scan)
+-- Total and free-food event counts from one pass over events
+-- Migration: 20250101000006
+-- ============================================
+
+-- Function: Total and free-food event counts
+CREATE OR REPLACE FUNCTION public.event_counts()
+RETURNS TABLE (
+    total_events BIGINT,
+    food_events BIGINT
+) AS $$
+    SELECT
+        COUNT(*) AS total_events,
+        COUNT(*) FILTER (WHERE has_free_food = TRUE) AS food_events
+    FROM public.events;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION public.event_counts IS 'Returns total and free-food event counts from a single scan';
+
+-- Function: Event and subscriber counts in one call (events scanned once)
+CREATE OR REPLACE FUNCTION public.get_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_events', ec.total_events,
+        'food_events', ec.food_events,
+        'active_users', (SELECT COUNT(*) FROM public.user_profiles WHERE notification_enabled = TRUE)
+    )
+    FROM public.event_counts() ec;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+-- SECURITY DEFINER bypasses RLS; keep it off the public API
+REVOKE EXECUTE ON FUNCTION public.event_counts() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.event_counts TO service_role;
@@ -0,0 +1,51 @@
+-- ============================================
+-- Insert Notification Function
+-- Hot-path notification insert with a cached plan
+-- Migration: 20250101000007
+-- ============================================
+
+-- Function: Insert a notification record
+-- (plpgsql caches the INSERT plan per connection, so repeated calls skip
+-- PostgREST query building and Postgres re-planning)
+CREATE OR REPLACE FUNCTION public.insert_notification(
+    user_id_param UUID,
+    event_id_param BIGINT,
+    channel_param VARCHAR DEFAULT 'email',
+    email_subject_param VARCHAR DEFAULT NULL,
+    extras JSONB DEFAULT '{}'::JSONB
+)
+RETURNS public.notifications AS $$
+DECLARE
+    result public.notifications;
+BEGIN
+    INSERT INTO public.notifications (
+        user_id,
+        event_id,
+        channel,
+        status,
+        email_subject,
+        email_message_id,
+        error_message,
+        retry_count,
+        next_retry_at
+    )
+    SELECT
+        user_id_param,
+        event_id_param,
+        channel_param,
+        COALESCE(r.status, 'pending'),
+        email_subject_param,
+        r.email_message_id,
+        r.error_message,
+        COALESCE(r.retry_count, 0),
+        r.next_retry_at
+    FROM jsonb_populate_record(NULL::public.notifications, extras) r
+    RETURNING * INTO result;
+
+    RETURN result;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION public.insert_notification IS 'Insert a notification (extras: status, email_message_id, error_message, retry_count, next_retry_at)';
+
+GRANT EXECUTE ON FUNCTION public.insert_notification TO service_role;
@@ -0,0 +1,49 @@
+-- ============================================
+-- Stats Snapshot
+-- Precomputed dashboard counts, refreshed every minute by pg_cron
+-- Migration: 20250101000008
+-- ============================================
+
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+
+-- Materialized view: one row with the counts get_stats() reports
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.stats_snapshot AS
+SELECT
+    1 AS id,
+    ec.total_events,
+    ec.food_events,
+    (SELECT COUNT(*) FROM public.user_profiles WHERE notification_enabled = TRUE) AS active_users,
+    NOW() AS refreshed_at
+FROM public.event_counts() ec;
+
+-- REFRESH ... CONCURRENTLY needs a unique index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_stats_snapshot_id ON public.stats_snapshot (id);
+
+COMMENT ON MATERIALIZED VIEW public.stats_snapshot IS 'Event and subscriber counts, refreshed every minute (see cron job refresh_stats_snapshot)';
+
+-- Materialized views are not covered by RLS; only reach it through get_stats()
+REVOKE ALL ON public.stats_snapshot FROM anon, authenticated;
+
+-- Refresh every minute without blocking readers (same job name replaces the schedule)
+SELECT cron.schedule(
+    'refresh_stats_snapshot',
+    '* * * * *',
+    'REFRESH MATERIALIZED VIEW CONCURRENTLY public.stats_snapshot'
+);
+
+-- Function: Event and subscriber counts from the snapshot (single-row lookup)
+CREATE OR REPLACE FUNCTION public.get_stats()
+RETURNS JSONB AS $$
+    SELECT jsonb_build_object(
+        'total_events', total_events,
+        'food_events', food_events,
+        'active_users', active_users
+    )
+    FROM public.stats_snapshot;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION public.get_stats IS 'Returns total_events, food_events and active_users counts as JSON (from stats_snapshot, up to a minute old)';
+
+-- SECURITY DEFINER reads stats_snapshot past the REVOKE above; backend only
+REVOKE EXECUTE ON FUNCTION public.get_stats() FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_stats TO service_role;
@@ -1,6 +1,20 @@
 """Pytest configuration and fixtures."""
 
+import threading
+from unittest.mock import MagicMock
+from uuid import uuid4
+
 import pytest
+from redis import Redis
+
+import services.database as database
+from services.mq import Consumer, MessageQueue
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "perf: timing-sensitive test (deselect with -m 'not perf')"
+    )
 
 
 @pytest.fixture
@@ -11,3 +25,85 @@ def sample_event():
         "location": "CS Building Room 140",
         "timestamp": "2025-10-30T12:00:00Z",
     }
+
+
+@pytest.fixture(scope="session")
+def uuid_pool():
+    """Pre-generated event IDs, so tests don't pay for uuid4() per event."""
+    return iter([str(uuid4()) for _ in range(10_000)])
+
+
+@pytest.fixture(scope="session")
+def message_queue():
+    """Create a MessageQueue instance shared by the whole test session."""
+    mq = MessageQueue()
+    yield mq
+    mq.close()
+
+
+@pytest.fixture(scope="session")
+def consumer():
+    """Create a Consumer shared by the whole test session.
+
+    The group is created once and recorded in ``Consumer._known_groups``,
+    so later ``_ensure_consumer_group`` calls skip Redis entirely.
+    """
+    consumer = Consumer(
+        consumer_group=f"test_group_{uuid4()}",
+        consumer_name=f"test_worker_{uuid4()}",
+    )
+    yield consumer
+    consumer.close()
+
+
+@pytest.fixture
+def offline_consumer():
+    """Consumer on a mock Redis client, for tests that only exercise decoding."""
+    consumer = Consumer(consumer_group="offline_group", consumer_name="offline_worker")
+    consumer._client = MagicMock(spec=Redis)
+    return consumer
+
+
+@pytest.fixture
+def consumer_factory():
+    """Build Consumers on fresh groups; all share the global Redis pool."""
+    consumers = []
+
+    def make(
+        group_prefix: str = "test_group",
+        consumer_name: str = "test_worker",
+        **kwargs,
+    ):
+        consumer = Consumer(
+            consumer_group=f"{group_prefix}_{uuid4()}",
+            consumer_name=consumer_name,
+            **kwargs,
+        )
+        consumers.append(consumer)
+        return consumer
+
+    yield make
+    for consumer in consumers:
+        consumer.close()
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, monkeypatch):
+    """Fresh SQLite database in tmp_path; records users-cache invalidations.
+
+    Yields the list that ``invalidate_users_cache()`` calls are appended to.
+    """
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "wtf.db"))
+    monkeypatch.setattr(database, "_thread_local", threading.local())
+    database.init_db()
+    # init_db() closes the thread-local connection; start every thread afresh
+    monkeypatch.setattr(database, "_thread_local", threading.local())
+
+    invalidations = []
+    monkeypatch.setattr(
+        database, "invalidate_users_cache", lambda: invalidations.append(True)
+    )
+    yield invalidations
+    connection = getattr(database._thread_local, "connection", None)
+    if connection is not None:
+        connection.close()
@@ -0,0 +1,72 @@
+"""Tests for the SQLite user helpers in services/database.py."""
+
+import services.database as database
+
+
+def emails(n: int, prefix: str = "user") -> list[str]:
+    return [f"{prefix}{i:04d}@example.com" for i in range(n)]
+
+
+def test_add_users_bulk_inserts_in_chunks(sqlite_db):
+    """Test that >500 emails are written with one INSERT per 500-row chunk."""
+    statements = []
+    database.get_connection().set_trace_callback(statements.append)
+
+    added, existing = database.add_users_bulk(emails(1201))
+
+    inserts = [s for s in statements if s.startswith("INSERT INTO users")]
+    assert len(inserts) == 3
+    assert added == emails(1201)
+    assert existing == []
+    assert database.count_active_users() == 1201
+
+
+def test_add_users_bulk_counts_duplicates_as_existing(sqlite_db):
+    """Test that stored emails and repeats within the batch are 'existing'."""
+    database.add_users_bulk(["a@example.com"])
+
+    added, existing = database.add_users_bulk(
+        ["b@example.com", "a@example.com", "b@example.com", "c@example.com"]
+    )
+
+    assert added == ["b@example.com", "c@example.com"]
+    assert existing == ["a@example.com", "b@example.com"]
+    assert database.count_active_users() == 3
+
+
+def test_add_users_bulk_invalidates_cache_only_when_added(sqlite_db):
+    """Test that the users cache is dropped only if a row was inserted."""
+    database.add_users_bulk(["a@example.com"])
+    assert sqlite_db == [True]
+
+    database.add_users_bulk(["a@example.com"])
+    database.add_users_bulk([])
+    assert sqlite_db == [True]
+
+
+def test_count_active_users_skips_inactive(sqlite_db):
+    """Test that deactivated users are not counted."""
+    database.add_users_bulk(["a@example.com", "b@example.com"])
+    database.get_connection().execute(
+        "UPDATE users SET active = 0 WHERE email = 'a@example.com'"
+    )
+
+    assert database.count_active_users() == 1
+
+
+def test_iter_active_users_sorted_across_batches(sqlite_db):
+    """Test that active emails come back sorted over several fetchmany calls."""
+    database.add_users_bulk(["d@x.com", "b@x.com", "e@x.com", "a@x.com", "c@x.com"])
+    conn = database.get_connection()
+    conn.execute("UPDATE users SET active = 0 WHERE email = 'c@x.com'")
+    conn.commit()
+
+    users = database.iter_active_users_sorted(batch_size=2)
+
+    assert next(users) == "a@x.com"
+    assert list(users) == ["b@x.com", "d@x.com", "e@x.com"]
+
+
+def test_iter_active_users_sorted_empty(sqlite_db):
+    """Test that an empty table yields nothing."""
+    assert list(database.iter_active_users_sorted()) == []
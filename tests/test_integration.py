@@ -16,9 +16,6 @@ from datetime import datetime, timezone
 from models import FreeFoodEvent
 from services.mq import MessageQueue, Consumer
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -119,8 +116,7 @@ def test_message_consume():
 
             if messages:
                 for stream, message_list in messages:
-                    for message_id, data in message_list:
-                        consumer._process_message(message_id, data, test_handler)
+                    consumer._process_batch(message_list, test_handler)
 
                 if events_received:
                     break
@@ -287,8 +283,6 @@ def main():
             logger.error(f"Test '{test_name}' raised exception: {e}")
             results[test_name] = False
 
-        time.sleep(1)  # Brief pause between tests
-
     # Summary
     logger.info("\n" + "=" * 70)
     logger.info("TEST SUMMARY")
@@ -316,5 +310,9 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
     exit_code = main()
     sys.exit(exit_code)
@@ -139,6 +139,9 @@ def test_consume(event_count, timeout=10):
         consumer_name=f"test_worker_{int(time.time())}",
     )
 
+    batch_size = 500
+    block_ms = 100
+
     try:
         while consumed_count < event_count:
             # Check timeout
@@ -148,19 +151,23 @@ def test_consume(event_count, timeout=10):
                 )
                 break
 
-            # Try to consume with a shorter block time
             messages = consumer.client.xreadgroup(
                 consumer.consumer_group,
                 consumer.consumer_name,
                 {consumer.stream_name: ">"},
-                count=10,
-                block=1000,  # 1 second block
+                count=batch_size,
+                block=block_ms,
             )
 
+            received = 0
             if messages:
                 for stream, message_list in messages:
-                    for message_id, data in message_list:
-                        consumer._process_message(message_id, data, handle_event)
+                    consumer._process_batch(message_list, handle_event)
+                    received += len(message_list)
+
+            # A full batch means more entries are probably waiting, so read
+            # again without blocking; otherwise wait briefly for new ones.
+            block_ms = None if received == batch_size else 100
 
         logger.info("=" * 70)
         logger.info(
@@ -195,9 +202,8 @@ def main():
         # Publish events (simulates LLM Agent processing and publishing)
         event_count = test_publish()
 
-        # Small delay to ensure messages are ready
-        time.sleep(1)
-
+        # Stream entries are readable as soon as XADD returns, and
+        # test_consume's blocking XREADGROUP waits for any stragglers.
         # Consume events (simulates MQ Consumer receiving events)
         consumed = test_consume(event_count, timeout=15)
 
@@ -47,9 +47,9 @@ def test_event_processor_process_event(sample_event):
 def test_event_processor_process_event_with_high_confidence(sample_event):
     """Test processing event with high confidence."""
     processor = EventProcessor()
-    sample_event.llm_confidence = 0.95
+    event = sample_event.model_copy(update={"llm_confidence": 0.95})
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -57,9 +57,9 @@ def test_event_processor_process_event_with_high_confidence(sample_event):
 def test_event_processor_process_event_with_low_confidence(sample_event):
     """Test processing event with low confidence."""
     processor = EventProcessor()
-    sample_event.llm_confidence = 0.3
+    event = sample_event.model_copy(update={"llm_confidence": 0.3})
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -67,9 +67,9 @@ def test_event_processor_process_event_with_low_confidence(sample_event):
 def test_event_processor_process_event_without_confidence(sample_event):
     """Test processing event without confidence score."""
     processor = EventProcessor()
-    sample_event.llm_confidence = None
+    event = sample_event.model_copy(update={"llm_confidence": None})
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -77,9 +77,9 @@ def test_event_processor_process_event_without_confidence(sample_event):
 def test_event_processor_process_event_without_reason(sample_event):
     """Test processing event without reason."""
     processor = EventProcessor()
-    sample_event.reason = None
+    event = sample_event.model_copy(update={"reason": None})
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -87,9 +87,9 @@ def test_event_processor_process_event_without_reason(sample_event):
 def test_event_processor_process_event_without_start_time(sample_event):
     """Test processing event without start time."""
     processor = EventProcessor()
-    sample_event.start_time = None
+    event = sample_event.model_copy(update={"start_time": None})
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -101,12 +101,12 @@ def test_event_processor_process_event_with_latency(sample_event):
     processor = EventProcessor()
 
     # Set published_at to a time in the past
-    sample_event.published_at = datetime.now(timezone.utc)
+    event = sample_event.model_copy(update={"published_at": datetime.now(timezone.utc)})
 
     # Wait a bit
     time.sleep(0.01)
 
-    processor.process_event(sample_event)
+    processor.process_event(event)
 
     assert processor.events_processed == 1
 
@@ -0,0 +1,419 @@
+"""Tests for the spider's crawl-path helpers."""
+
+import asyncio
+import contextlib
+import datetime as dt
+import json
+import time
+from types import SimpleNamespace
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import pytest
+
+import services.spider.__main__ as spider
+from services.spider.__main__ import (
+    AsyncHttpClient,
+    FreeFoodEvent,
+    GeminiBatcher,
+    HostThrottle,
+    PageCache,
+    PageSkipped,
+)
+
+
+@contextlib.asynccontextmanager
+async def serve(*routes: web.RouteDef):
+    """Run an aiohttp app with ``routes`` on a free local port."""
+    app = web.Application()
+    app.add_routes(routes)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield server
+    finally:
+        await server.close()
+
+
+def http_client(**kwargs) -> AsyncHttpClient:
+    return AsyncHttpClient(polite_delay_s=0, max_retries=0, **kwargs)
+
+
+class StubGemini:
+    """Stands in for genai.Client; ``respond`` maps the prompt to a reply."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.prompts = []
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._call))
+
+    async def _call(self, model, contents, config):
+        self.prompts.append(contents[1])
+        return SimpleNamespace(text=self.respond(contents[1]))
+
+
+def event_page(title: str = "Pizza Social") -> str:
+    """An event page with a JSON-LD Event two days out that mentions free food."""
+    start = (dt.datetime.now(dt.timezone.utc) + dt.timedelta(days=2)).isoformat()
+    event = {
+        "@type": "Event",
+        "name": title,
+        "startDate": start,
+        "location": {"name": "Campus Center"},
+        "description": "Free pizza for everyone!",
+    }
+    return (
+        '<html><head><script type="application/ld+json">'
+        f"{json.dumps(event)}</script></head>"
+        "<body><p>Free pizza for everyone!</p></body></html>"
+    )
+
+
+async def crawl(server, page_cache, min_confidence=0.6):
+    async with http_client() as http, GeminiBatcher(window_ms=0) as gemini:
+        return await spider._crawl(
+            seed_url=str(server.make_url("/")),
+            days_lookahead=30,
+            max_pages=5,
+            max_depth=0,
+            min_confidence=min_confidence,
+            restrict_to_same_site=True,
+            save_to_db=False,
+            http=http,
+            gemini=gemini,
+            page_cache=page_cache,
+        )
+
+
+def test_fetch_page_without_charset():
+    """Test that a text/html page with no charset is decoded as UTF-8."""
+
+    async def page(request):
+        return web.Response(
+            body="<html>café</html>".encode(), headers={"Content-Type": "text/html"}
+        )
+
+    async def run():
+        async with serve(web.get("/", page)) as server:
+            async with http_client() as http:
+                return await http.fetch(str(server.make_url("/")))
+
+    html, status, _ = asyncio.run(run())
+
+    assert status == 200
+    assert html == "<html>café</html>"
+
+
+def test_failed_gemini_call_leaves_outcome_unset(monkeypatch, tmp_path):
+    """Test that a Gemini error is counted and not cached as "no food"."""
+
+    def respond(prompt):
+        raise RuntimeError("quota exceeded")
+
+    stub = StubGemini(respond)
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+    page_cache = PageCache(str(tmp_path / "cache.sqlite3"))
+
+    async def page(request):
+        return web.Response(text=event_page(), content_type="text/html")
+
+    async def run():
+        async with serve(web.get("/", page)) as server:
+            return str(server.make_url("/")), await crawl(server, page_cache)
+
+    url, (events, stats) = asyncio.run(run())
+
+    assert events == []
+    assert stats.gemini_errors == 1
+    assert page_cache.get(url)["outcome"] is None
+    page_cache.close()
+
+
+def test_low_confidence_verdict_is_not_persisted(monkeypatch, tmp_path):
+    """Test that a verdict rejected only by min_confidence is not cached."""
+    verdict = [
+        {"event_index": 1, "has_free_food": True, "confidence": 0.5, "proof": "pizza"}
+    ]
+    stub = StubGemini(lambda _: json.dumps(verdict))
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+    page_cache = PageCache(str(tmp_path / "cache.sqlite3"))
+
+    async def page(request):
+        return web.Response(text=event_page(), content_type="text/html")
+
+    async def run():
+        async with serve(web.get("/", page)) as server:
+            url = str(server.make_url("/"))
+            return url, await crawl(server, page_cache, min_confidence=0.6)
+
+    url, (events, _) = asyncio.run(run())
+
+    assert events == []
+    assert page_cache.get(url)["outcome"] is None
+    page_cache.close()
+
+
+def test_gemini_client_rebuilt_per_event_loop(monkeypatch):
+    """Test that each event loop gets its own Gemini client (and pool)."""
+    monkeypatch.setattr(spider, "GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(spider, "_gemini", None)
+
+    async def get_twice():
+        return spider.get_gemini_client(), spider.get_gemini_client()
+
+    first_a, first_b = asyncio.run(get_twice())
+    second, _ = asyncio.run(get_twice())
+
+    assert first_a is first_b
+    assert second is not first_a
+
+
+# ============================================================================
+# Page parsing
+# ============================================================================
+
+
+def test_parse_page_once_returns_links_event_and_text():
+    """Test that one parse yields absolute links, the JSON-LD event and text."""
+    html = event_page().replace(
+        "<body>", '<body><a href="/a">A</a><a href="/a">again</a>'
+    )
+
+    links, ev, text = spider._parse_page_once(html, "https://events.example.edu/x")
+
+    assert links == ["https://events.example.edu/a"]
+    assert ev["title"] == "Pizza Social"
+    assert ev["location"] == "Campus Center"
+    assert "Free pizza for everyone!" in text
+
+
+# ============================================================================
+# Page cache
+# ============================================================================
+
+
+def make_event(url: str) -> FreeFoodEvent:
+    return FreeFoodEvent(
+        source_url=url,
+        title="Pizza Social",
+        start="2030-01-01T17:00:00Z",
+        end=None,
+        location="Campus Center",
+        description=None,
+        proof="free pizza",
+        confidence=0.9,
+        event_id="evt-1",
+    )
+
+
+def test_page_cache_round_trip(tmp_path):
+    """Test that pages, validators and outcomes survive a reopen."""
+    path = str(tmp_path / "cache.sqlite3")
+    url = "https://events.example.edu/x"
+
+    page_cache = PageCache(path)
+    page_cache.save_page(url, '"v1"', "Tue, 01 Jan 2030 00:00:00 GMT", ["/a"])
+    # Outcome not settled yet: nothing to revalidate with
+    assert page_cache.get(url)["outcome"] is None
+    assert PageCache.conditional_headers(page_cache.get(url)) == {}
+
+    page_cache.set_outcome(url, make_event(url))
+    page_cache.close()
+
+    entry = PageCache(path).get(url)
+    assert entry["links"] == ["/a"]
+    assert entry["outcome"] == "event"
+    assert entry["event"]["event_id"] == "evt-1"
+    assert PageCache.conditional_headers(entry) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 01 Jan 2030 00:00:00 GMT",
+    }
+    assert PageCache(path).get("https://events.example.edu/other") is None
+
+
+def test_page_cache_commits_periodically(tmp_path):
+    """Test that rows are committed before close()."""
+    import sqlite3
+
+    path = str(tmp_path / "cache.sqlite3")
+    page_cache = PageCache(path, commit_every=2)
+    page_cache.save_page("https://events.example.edu/x", None, None, [])
+    page_cache.set_outcome("https://events.example.edu/x", None)
+
+    rows = sqlite3.connect(path).execute("SELECT outcome FROM pages").fetchall()
+    assert rows == [("none",)]
+    page_cache.close()
+
+
+def test_not_modified_page_reuses_cached_event(monkeypatch, tmp_path):
+    """Test that a 304 on the next run reuses the event without Gemini."""
+    verdict = [
+        {"event_index": 1, "has_free_food": True, "confidence": 0.9, "proof": "pizza"}
+    ]
+    stub = StubGemini(lambda _: json.dumps(verdict))
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+    path = str(tmp_path / "cache.sqlite3")
+    html = event_page()
+
+    async def page(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(
+            text=html, content_type="text/html", headers={"ETag": '"v1"'}
+        )
+
+    async def run():
+        async with serve(web.get("/", page)) as server:
+            runs = []
+            for _ in range(2):
+                page_cache = PageCache(path)
+                runs.append(await crawl(server, page_cache))
+                page_cache.close()
+            return runs
+
+    (first, first_stats), (second, second_stats) = asyncio.run(run())
+
+    assert len(stub.prompts) == 1
+    assert first_stats.not_modified == 0
+    assert second_stats.not_modified == 1
+    assert [e["event_id"] for e in second] == [e["event_id"] for e in first]
+    assert len(first) == 1
+
+
+# ============================================================================
+# Gemini batching
+# ============================================================================
+
+
+def test_gemini_batcher_maps_verdicts_by_index(monkeypatch):
+    """Test that one call confirms a batch and verdicts follow event_index."""
+    # Out of order, and no verdict at all for EVENT 2
+    reply = [
+        {"event_index": 3, "has_free_food": True, "confidence": 0.8, "proof": "C"},
+        {"event_index": 1, "has_free_food": False, "confidence": 0.9, "proof": ""},
+    ]
+    stub = StubGemini(lambda _: json.dumps(reply))
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+
+    async def run():
+        async with GeminiBatcher(max_batch=3, window_ms=1000) as gemini:
+            return await asyncio.gather(
+                gemini.confirm("A"), gemini.confirm("B"), gemini.confirm("C")
+            )
+
+    verdicts = asyncio.run(run())
+
+    assert len(stub.prompts) == 1
+    assert stub.prompts[0].count("EVENT ") == 3
+    assert verdicts == [(False, 0.9, ""), None, (True, 0.8, "C")]
+
+
+def test_gemini_batcher_flushes_partial_batch_after_window(monkeypatch):
+    """Test that a lone confirmation is sent once the window closes."""
+    reply = [{"event_index": 1, "has_free_food": True, "confidence": 1, "proof": "x"}]
+    stub = StubGemini(lambda _: json.dumps(reply))
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+
+    async def run():
+        async with GeminiBatcher(max_batch=8, window_ms=10) as gemini:
+            return await asyncio.wait_for(gemini.confirm("A"), timeout=2)
+
+    assert asyncio.run(run()) == (True, 1.0, "x")
+
+
+def test_gemini_batcher_propagates_errors(monkeypatch):
+    """Test that a failed Gemini call fails every caller in the batch."""
+
+    def respond(prompt):
+        raise RuntimeError("quota exceeded")
+
+    stub = StubGemini(respond)
+    monkeypatch.setattr(spider, "get_gemini_client", lambda: stub)
+
+    async def run():
+        async with GeminiBatcher(max_batch=2, window_ms=1000) as gemini:
+            return await asyncio.gather(
+                gemini.confirm("A"), gemini.confirm("B"), return_exceptions=True
+            )
+
+    results = asyncio.run(run())
+
+    assert [type(r) for r in results] == [RuntimeError, RuntimeError]
+
+
+# ============================================================================
+# Fetch skips
+# ============================================================================
+
+
+def fetch_skip_reason(handler) -> str:
+    async def run():
+        async with serve(web.get("/", handler)) as server:
+            async with http_client() as http:
+                await http.fetch(str(server.make_url("/")))
+
+    with pytest.raises(PageSkipped) as excinfo:
+        asyncio.run(run())
+    return excinfo.value.reason
+
+
+def test_fetch_skips_non_html():
+    """Test that non-HTML content types are skipped without a download."""
+
+    async def pdf(request):
+        return web.Response(body=b"%PDF-1.7", content_type="application/pdf")
+
+    assert fetch_skip_reason(pdf) == "non_html"
+
+
+def test_fetch_skips_declared_oversized_page(monkeypatch):
+    """Test that a Content-Length over the cap is skipped up front."""
+    monkeypatch.setattr(spider, "MAX_PAGE_BYTES", 100)
+
+    async def big(request):
+        return web.Response(text="x" * 500, content_type="text/html")
+
+    assert fetch_skip_reason(big) == "too_large"
+
+
+def test_fetch_caps_streamed_page(monkeypatch):
+    """Test that a chunked body is abandoned once it passes the cap."""
+    monkeypatch.setattr(spider, "MAX_PAGE_BYTES", 1000)
+
+    async def streamed(request):
+        response = web.StreamResponse(headers={"Content-Type": "text/html"})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        for _ in range(10):
+            await response.write(b"x" * 500)
+        return response
+
+    assert fetch_skip_reason(streamed) == "too_large"
+
+
+# ============================================================================
+# Per-host throttle
+# ============================================================================
+
+
+def test_host_throttle_spaces_requests_per_host():
+    """Test that requests to one host are spaced and other hosts are not."""
+    throttle = HostThrottle(min_interval_s=0.05)
+
+    async def timed(urls):
+        t0 = time.perf_counter()
+        for url in urls:
+            await throttle.wait(url)
+        return time.perf_counter() - t0
+
+    async def run():
+        same_host = await timed(["https://a.example/1"] * 3)
+        other_host = await timed(["https://b.example/1"])
+        return same_host, other_host
+
+    same_host, other_host = asyncio.run(run())
+
+    # Three requests need two full gaps; a fresh host goes straight through
+    assert same_host >= 0.1
+    assert other_host < 0.05
@@ -0,0 +1,75 @@
+"""Tests for the subscription API's bulk and streaming endpoints."""
+
+import importlib
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import services.database as database
+
+
+@pytest.fixture
+def client(sqlite_db, monkeypatch):
+    """TestClient on the subscription API, backed by a temporary database."""
+    # Imported here so its init_db() runs against the temporary DB_PATH;
+    # that closes this thread's connection on first import, so reset it
+    api = importlib.import_module("services.subscription_api")
+    monkeypatch.setattr(database, "_thread_local", threading.local())
+    with TestClient(api.app) as client:
+        yield client
+
+
+def test_subscribe_bulk_reports_added_and_existing(client, sqlite_db):
+    """Test that bulk subscribe splits new and already-subscribed emails."""
+    database.add_users_bulk(["a@example.com"])
+
+    response = client.post(
+        "/subscribe/bulk",
+        json={"emails": ["b@example.com", "a@example.com", "b@example.com"]},
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {
+        "message": "Subscribed 1 email(s)",
+        "added": ["b@example.com"],
+        "already_subscribed": ["a@example.com", "b@example.com"],
+    }
+    assert len(sqlite_db) == 2  # one invalidation per call that added rows
+
+
+def test_subscribe_bulk_large_batch(client):
+    """Test a batch larger than one INSERT chunk."""
+    emails = [f"user{i:04d}@example.com" for i in range(1201)]
+
+    response = client.post("/subscribe/bulk", json={"emails": emails})
+
+    assert response.json()["added"] == emails
+    assert database.count_active_users() == 1201
+
+
+def test_list_subscribers_streams_sorted_json(client):
+    """Test the exact streamed body: count first, then sorted emails."""
+    database.add_users_bulk(["c@example.com", "a@example.com", 'b@"quoted".com'])
+    conn = database.get_connection()
+    conn.execute("UPDATE users SET active = 0 WHERE email = 'c@example.com'")
+    conn.commit()
+
+    response = client.get("/subscribers")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.text == (
+        '{"count": 2, "subscribers": ["a@example.com","b@\\"quoted\\".com"]}'
+    )
+    assert json.loads(response.text) == {
+        "count": 2,
+        "subscribers": ["a@example.com", 'b@"quoted".com'],
+    }
+
+
+def test_list_subscribers_empty(client):
+    """Test that an empty subscriber list is still valid JSON."""
+    response = client.get("/subscribers")
+
+    assert response.text == '{"count": 0, "subscribers": []}'
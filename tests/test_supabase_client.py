@@ -0,0 +1,327 @@
+"""Tests for the Supabase helpers, against a mocked Supabase client."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from postgrest.exceptions import APIError
+
+import services.supabase_client as db
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    """Mock sync Supabase client returned by get_supabase_client()."""
+    client = MagicMock()
+    monkeypatch.setattr(db, "get_supabase_client", lambda: client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def empty_caches(monkeypatch):
+    """Start every test with cold in-process caches."""
+    monkeypatch.setattr(db, "_active_users_cache", None)
+    monkeypatch.setattr(db, "_stats_cache", None)
+    monkeypatch.setattr(db, "_sources_cache", {})
+    monkeypatch.setattr(db, "_categories_cache", {})
+
+
+@pytest.fixture
+def invalidated(monkeypatch):
+    """User ids whose notification inbox cache was invalidated."""
+    user_ids = []
+    monkeypatch.setattr(
+        db, "invalidate_notifications_cache", lambda *ids: user_ids.extend(ids)
+    )
+    return user_ids
+
+
+def test_add_notifications_bulk_inserts_one_request(supabase, invalidated):
+    """Test that bulk insert fills defaults and sends all rows at once."""
+    insert = supabase.table.return_value.insert
+    insert.return_value.execute.return_value = SimpleNamespace(data=[{"id": 1}])
+
+    rows = db.add_notifications_bulk(
+        [
+            {"user_id": "u1", "event_id": 1},
+            {"user_id": "u2", "event_id": 1, "channel": "sms", "status": "sent"},
+        ]
+    )
+
+    assert rows == [{"id": 1}]
+    supabase.table.assert_called_once_with("notifications")
+    insert.assert_called_once_with(
+        [
+            {
+                "user_id": "u1",
+                "event_id": 1,
+                "channel": "email",
+                "status": "pending",
+                "email_subject": None,
+            },
+            {
+                "user_id": "u2",
+                "event_id": 1,
+                "channel": "sms",
+                "status": "sent",
+                "email_subject": None,
+            },
+        ]
+    )
+    assert invalidated == ["u1", "u2"]
+
+
+def test_add_notifications_bulk_empty_skips_request(supabase):
+    """Test that an empty batch makes no request."""
+    assert db.add_notifications_bulk([]) == []
+    supabase.table.assert_not_called()
+
+
+def test_add_notifications_bulk_failure_returns_default(supabase, invalidated):
+    """Test that a failed bulk insert returns [] and invalidates nothing."""
+    supabase.table.return_value.insert.return_value.execute.side_effect = RuntimeError(
+        "boom"
+    )
+
+    assert db.add_notifications_bulk([{"user_id": "u1", "event_id": 1}]) == []
+    assert invalidated == []
+
+
+def test_add_notifications_bulk_async(monkeypatch, invalidated):
+    """Test the async bulk insert against a mocked async client."""
+    client = MagicMock()
+    insert = client.table.return_value.insert
+    insert.return_value.execute = AsyncMock(
+        return_value=SimpleNamespace(data=[{"id": 7}])
+    )
+
+    async def get_client():
+        return client
+
+    monkeypatch.setattr(db, "get_async_supabase_client", get_client)
+
+    rows = asyncio.run(
+        db.add_notifications_bulk_async([{"user_id": "u1", "event_id": 3}])
+    )
+
+    assert rows == [{"id": 7}]
+    assert insert.call_args.args[0][0]["status"] == "pending"
+    assert invalidated == ["u1"]
+
+
+def test_record_notification_sends_final_status(supabase, invalidated):
+    """Test that record_notification writes the status in the one insert."""
+    rpc = supabase.rpc
+    rpc.return_value.execute.return_value = SimpleNamespace(data={"id": 5})
+
+    assert db.record_notification("u1", 3, "sent") == {"id": 5}
+
+    name, params = rpc.call_args.args
+    assert name == "insert_notification"
+    assert params["extras"] == {"status": "sent"}
+    assert invalidated == ["u1"]
+
+
+def test_update_notifications_status_uses_one_request(supabase, invalidated):
+    """Test that many ids are updated with a single IN filter."""
+    update = supabase.table.return_value.update
+    in_ = update.return_value.in_
+    in_.return_value.execute.return_value = SimpleNamespace(
+        data=[{"id": 1, "user_id": "u1"}, {"id": 2, "user_id": "u2"}]
+    )
+
+    assert db.update_notifications_status([1, 2], "delivered") == 2
+
+    update.assert_called_once_with({"status": "delivered"})
+    in_.assert_called_once_with("id", [1, 2])
+    assert invalidated == ["u1", "u2"]
+
+
+def test_update_notifications_status_empty_skips_request(supabase):
+    """Test that an empty id list makes no request."""
+    assert db.update_notifications_status([], "sent") == 0
+    supabase.table.assert_not_called()
+
+
+# ============================================================================
+# safe_db
+# ============================================================================
+
+
+def test_safe_db_returns_copy_of_default_and_counts():
+    """Test that failures return a fresh default and are counted."""
+    default = []
+
+    @db.safe_db(default)
+    def failing_helper():
+        raise RuntimeError("down")
+
+    before = db.db_error_counts["failing_helper"]
+    result = failing_helper()
+
+    assert result == [] and result is not default
+    result.append("x")
+    assert failing_helper() == []
+    assert db.db_error_counts["failing_helper"] == before + 2
+
+
+def test_safe_db_wraps_async_helpers():
+    """Test that async helpers are awaited and their failures swallowed."""
+
+    @db.safe_db({"ok": False})
+    async def failing_async_helper():
+        raise RuntimeError("down")
+
+    before = db.db_error_counts["failing_async_helper"]
+
+    assert asyncio.run(failing_async_helper()) == {"ok": False}
+    assert db.db_error_counts["failing_async_helper"] == before + 1
+
+
+# ============================================================================
+# In-process TTL caches
+# ============================================================================
+
+
+def test_active_users_cached_until_ttl(supabase, monkeypatch):
+    """Test that active users are served from cache within the TTL."""
+    rpc = supabase.rpc
+    rpc.return_value.execute.return_value = SimpleNamespace(data=[{"email": "a@x"}])
+
+    assert db.get_active_users() == ["a@x"]
+    assert db.get_active_users() == ["a@x"]
+    assert rpc.call_count == 1
+
+    monkeypatch.setattr(db, "ACTIVE_USERS_CACHE_TTL", 0)
+    db.get_active_users()
+    assert rpc.call_count == 2
+
+
+def test_active_users_cache_invalidated_on_deactivate(supabase):
+    """Test that deactivating a user drops the cached subscriber list."""
+    rpc = supabase.rpc
+    rpc.return_value.execute.return_value = SimpleNamespace(data=[{"email": "a@x"}])
+    update = supabase.table.return_value.update
+    update.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+        data=[{"email": "a@x"}]
+    )
+
+    db.get_active_users()
+    assert db.deactivate_user("a@x") is True
+    db.get_active_users()
+
+    assert rpc.call_count == 2
+
+
+def test_event_sources_cached_per_flag(supabase, monkeypatch):
+    """Test that sources are cached per active_only and cleared on demand."""
+    query = supabase.table.return_value.select.return_value
+    query.eq.return_value.order.return_value.execute.return_value = SimpleNamespace(
+        data=[{"id": 1}]
+    )
+    query.order.return_value.execute.return_value = SimpleNamespace(
+        data=[{"id": 1}, {"id": 2}]
+    )
+
+    assert db.get_event_sources() == [{"id": 1}]
+    assert db.get_event_sources(active_only=False) == [{"id": 1}, {"id": 2}]
+    db.get_event_sources()
+    assert supabase.table.call_count == 2
+
+    db.invalidate_sources_cache()
+    db.get_event_sources()
+    assert supabase.table.call_count == 3
+
+    monkeypatch.setattr(db, "REFERENCE_CACHE_TTL", 0)
+    db.get_event_sources()
+    assert supabase.table.call_count == 4
+
+
+# ============================================================================
+# get_stats
+# ============================================================================
+
+
+def test_get_stats_uses_rpc_and_caches(supabase):
+    """Test that stats come from one RPC and are reused within the TTL."""
+    rpc = supabase.rpc
+    rpc.return_value.execute.return_value = SimpleNamespace(
+        data={"total_events": 10, "food_events": 4, "active_users": 3}
+    )
+
+    assert db.get_stats() == {"total_events": 10, "food_events": 4, "active_users": 3}
+    db.get_stats()
+
+    rpc.assert_called_once_with("get_stats")
+
+
+def test_get_stats_falls_back_to_counts_without_function(supabase):
+    """Test that a missing get_stats() function (PGRST202) uses count queries."""
+    supabase.rpc.return_value.execute.side_effect = APIError(
+        {"code": "PGRST202", "message": "function not found"}
+    )
+    select = supabase.table.return_value.select
+    select.return_value.execute.return_value = SimpleNamespace(count=10)
+    select.return_value.eq.return_value.execute.return_value = SimpleNamespace(count=4)
+
+    assert db.get_stats() == {"total_events": 10, "food_events": 4, "active_users": 4}
+    select.assert_called_with("id", count="exact", head=True)
+
+
+def test_get_stats_other_api_errors_return_default(supabase):
+    """Test that other API errors are not masked by the fallback."""
+    supabase.rpc.return_value.execute.side_effect = APIError(
+        {"code": "42501", "message": "permission denied"}
+    )
+
+    assert db.get_stats() == {"total_events": 0, "food_events": 0, "active_users": 0}
+    supabase.table.assert_not_called()
+
+
+# ============================================================================
+# Redis notification inbox cache
+# ============================================================================
+
+
+@pytest.fixture
+def redis_client():
+    """Redis on the shared pool (REDIS_URL), as used by the inbox cache."""
+    return db._redis_client()
+
+
+def test_notifications_cached_with_ttl(supabase, redis_client):
+    """Test that an inbox read fills the hash (per limit) and sets a TTL."""
+    user_id = str(uuid4())
+    query = supabase.table.return_value.select.return_value.eq.return_value
+    execute = query.order.return_value.limit.return_value.execute
+    execute.return_value = SimpleNamespace(data=[{"id": 1}])
+    key = f"notifications:{user_id}"
+
+    assert db.get_user_notifications(user_id, limit=10) == [{"id": 1}]
+    assert db.get_user_notifications(user_id, limit=10) == [{"id": 1}]
+
+    assert execute.call_count == 1
+    assert redis_client.hkeys(key) == ["10"]
+    assert 0 < redis_client.ttl(key) <= db.NOTIFICATIONS_CACHE_TTL
+    redis_client.delete(key)
+
+
+def test_notifications_cache_dropped_on_add_and_update(supabase, redis_client):
+    """Test that adding or updating a notification drops the user's inbox."""
+    user_id = str(uuid4())
+    key = f"notifications:{user_id}"
+    supabase.rpc.return_value.execute.return_value = SimpleNamespace(data={"id": 1})
+    update = supabase.table.return_value.update
+    update.return_value.eq.return_value.execute.return_value = SimpleNamespace(
+        data=[{"id": 1, "user_id": user_id}]
+    )
+
+    redis_client.hset(key, "50", "[]")
+    db.add_notification(user_id, 1)
+    assert not redis_client.exists(key)
+
+    redis_client.hset(key, "50", "[]")
+    assert db.update_notification_status(1, "sent") is True
+    assert not redis_client.exists(key)